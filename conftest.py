@@ -0,0 +1,31 @@
+"""Let the tests import markdown_editor on machines without a usable QtWebEngine."""
+
+import os
+import sys
+import types
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    import PySide6.QtWebEngineWidgets  # noqa: F401
+except ImportError:
+    # Headless CI images often lack the system libraries QtWebEngine links
+    # against. The tests never show the preview, so a plain widget will do.
+    from PySide6.QtCore import Signal
+    from PySide6.QtWidgets import QWidget
+
+    class QWebEngineView(QWidget):
+        loadFinished = Signal(bool)
+
+        def setHtml(self, html, *args):
+            pass
+
+        def page(self):
+            return self
+
+        def runJavaScript(self, script, *args):
+            pass
+
+    web_engine_widgets = types.ModuleType("PySide6.QtWebEngineWidgets")
+    web_engine_widgets.QWebEngineView = QWebEngineView
+    sys.modules["PySide6.QtWebEngineWidgets"] = web_engine_widgets
@@ -6,47 +6,41 @@ A modern, cross-platform desktop markdown editor built with PySide6 (Qt6 for Pyt
 import sys
 import os
 import re
+import json
+import string
+import functools
+import hashlib
+import importlib.util
+import threading
+import time
 import markdown
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
-                               QHBoxLayout, QTextEdit, QSplitter, QMenuBar,
+                               QHBoxLayout, QPlainTextEdit, QSplitter, QMenuBar,
                                QMenu, QFileDialog, QMessageBox, QLabel,
                                QGroupBox, QScrollArea, QPushButton, QDockWidget,
                                QDialog, QLineEdit, QCheckBox)
-from PySide6.QtCore import Qt, QTimer, QRegularExpression, QSettings
+from PySide6.QtCore import (Qt, QTimer, QRegularExpression, QSettings, QObject,
+                            QRunnable, QThreadPool, Signal)
 from PySide6.QtGui import QFont, QColor, QPalette, QSyntaxHighlighter, QTextCharFormat, QTextDocument
 from PySide6.QtWebEngineWidgets import QWebEngineView
-from collections import Counter
 from datetime import datetime
 
 
-try:
-    from docx import Document
-    from docx.shared import Inches
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
+def _module_available(name: str) -> bool:
+    """Return whether a module is installed, without importing it."""
 
-try:
-    from reportlab.pdfgen import canvas
-    from reportlab.lib.pagesizes import letter
-    from reportlab.lib.units import inch
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-    from reportlab.lib.styles import getSampleStyleSheet
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
 
-try:
-    import weasyprint
-    WEASYPRINT_AVAILABLE = True
-except ImportError:
-    WEASYPRINT_AVAILABLE = False
 
-try:
-    import html2text
-    HTML2TEXT_AVAILABLE = True
-except ImportError:
-    HTML2TEXT_AVAILABLE = False
+# Export backends are slow to import, so they are only probed here and
+# imported by the exporter that needs them.
+DOCX_AVAILABLE = _module_available('docx')
+PDF_AVAILABLE = _module_available('reportlab')
+WEASYPRINT_AVAILABLE = _module_available('weasyprint')
+HTML2TEXT_AVAILABLE = _module_available('html2text')
 
 try:
     from pygments.formatters import HtmlFormatter
@@ -55,6 +49,820 @@ except ImportError:
     PYGMENTS_AVAILABLE = False
 
 
+_RE_WORD = re.compile(r'\w+')
+_ASCII_WORD_CLASSES = bytes(
+    ord('w') if chr(i).isalnum() or chr(i) == '_' else ord(' ') for i in range(256)
+)
+_RE_LINK = re.compile(r'\[([^\]]+)\]\(([^\)]+)\)')
+_RE_IMAGE = re.compile(r'!\[([^\]]*)\]\(([^\)]+)\)')
+_RE_LIST_OL = re.compile(r'^\s*\d+\.\s+')
+_RE_EMPTY_LINK = re.compile(r'\[([^\]]+)\]\(\s*\)')
+# Inline spans rewritten by the docx, PDF, RTF and ODT exporters, matched
+# in one left-to-right pass; the group name selects the format's markup.
+# Italic is tried first and steps over inner **x** spans, so ***x*** and
+# *a **b** c* nest instead of leaving a stray '*'; a bare '**' is dropped.
+_RE_INLINE_MARKUP = re.compile(
+    r'(?=[*`\[])(?:'
+    r'\*(?P<italic>(?:\*\*[^*\n]+\*\*|[^*\n])+)\*'
+    r'|\*\*(?P<bold>.*?)\*\*'
+    r'|`(?P<code>.*?)`'
+    r'|\[(?P<link>[^\]]+)\]\([^\)]+\)'
+    r'|\*\*)'
+)
+_PLAIN_INLINE_MARKUP = {
+    'bold': ('', ''),
+    'italic': ('', ''),
+    'code': ('', ''),
+    'link': ('', ''),
+}
+_PDF_INLINE_MARKUP = {
+    'bold': ('<b>', '</b>'),
+    'italic': ('<i>', '</i>'),
+    'code': ('<font name="Courier">', '</font>'),
+    'link': ('', ''),
+}
+_RTF_INLINE_MARKUP = {
+    'bold': (r'{\b ', '}'),
+    'italic': (r'{\i ', '}'),
+    'code': (r'{\f1\fs18 ', '}'),
+    'link': ('', ''),
+}
+# Everything export_as_text strips, matched in one pass. Groups: 1 italic,
+# 2 bold, 3 fenced code, 4 inline code, 5 image alt text, 6 link text; a
+# heading marker or bare '**' matches no group. Emphasis nests as in
+# _RE_INLINE_MARKUP.
+_RE_PLAIN_TEXT_MARKUP = re.compile(
+    r'(?=[#*`!\[])(?:'
+    r'^#{1,6}\s+'
+    r'|\*((?:\*\*[^*\n]+\*\*|[^*\n])+)\*'
+    r'|\*\*(.*?)\*\*'
+    r'|(?s:```.*?\n(.*?)\n```)'
+    r'|`(.*?)`'
+    r'|!\[([^\]]*)\]\([^\)]+\)'
+    r'|\[([^\]]+)\]\([^\)]+\)'
+    r'|\*\*)',
+    re.MULTILINE,
+)
+
+_RE_FMT_HEADING = re.compile(r'^(#{1,6})(\S)')
+
+_RENDER_CACHE_SIZE = 8
+
+# Seconds a custom preview stylesheet is trusted before it is stat'ed again.
+_CSS_STAT_INTERVAL = 0.5
+
+# Preview and analysis debounce delays in milliseconds. Keystrokes arriving
+# less than _RAPID_TYPING_INTERVAL seconds apart use the longer pair.
+_PREVIEW_DELAY_MS = 300
+_ANALYSIS_DELAY_MS = 800
+_RAPID_PREVIEW_DELAY_MS = 600
+_RAPID_ANALYSIS_DELAY_MS = 1500
+_RAPID_TYPING_INTERVAL = 0.1
+
+# Finds the body container of our preview shell; pages reached by following a
+# link may have their own #content, but not this attribute.
+_PREVIEW_CONTENT_SELECTOR = '#content[data-smart-markdown-preview]'
+
+# RTF half-point font sizes for heading levels 1-6.
+_RTF_HEADING_SIZES = ('', '36', '32', '28', '26', '24', '22')
+
+_ODT_CONTENT_HEADER = (
+    "<?xml version='1.0' encoding='utf-8'?>\n"
+    '<office:document-content'
+    ' xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"'
+    ' xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0"'
+    ' xmlns:style="urn:oasis:names:tc:opendocument:xmlns:style:1.0"'
+    ' office:version="1.0"><office:body><office:text>'
+)
+_ODT_CONTENT_FOOTER = '</office:text></office:body></office:document-content>'
+_ODT_MIMETYPE = b'application/vnd.oasis.opendocument.text'
+_ODT_MANIFEST = (
+    b"<?xml version='1.0' encoding='utf-8'?>\n"
+    b'<manifest:manifest xmlns:manifest="urn:oasis:names:tc:opendocument:xmlns:manifest:1.0">'
+    b'<manifest:file-entry manifest:full-path="/" manifest:media-type="application/vnd.oasis.opendocument.text" />'
+    b'<manifest:file-entry manifest:full-path="content.xml" manifest:media-type="text/xml" />'
+    b'</manifest:manifest>'
+)
+
+# Top-level preview blocks: split at blank lines followed by a line that can
+# only start a new paragraph-level block (not a list item, quote, indented
+# continuation or raw HTML, which Markdown may join with what precedes them).
+_RE_PREVIEW_BLOCK_SPLIT = re.compile(r'\n(?:[ \t]*\n)+(?=[^\s\-*+>0-9<])')
+# Constructs whose rendering depends on the whole document.
+_RE_PREVIEW_WHOLE_DOC = re.compile(r'\]:|<[A-Za-z/!?]|\[TOC\]')
+_RE_HEADING_ID = re.compile(r'<h[1-6] id="([^"]*)"')
+_markdown_local = threading.local()
+
+_INLINE_MARKERS = ('`', '*', '_', '[', '(')
+_FENCE_INDENT_CHARS = ' \t\r\f\v'
+_INLINE_BOLD = 2
+_INLINE_ITALIC = 3
+
+
+@functools.lru_cache(maxsize=16)
+def _pygments_css(style_name: str) -> str:
+    """Return the .codehilite stylesheet for a Pygments style, or "" without Pygments."""
+
+    if not PYGMENTS_AVAILABLE:
+        return ""
+    return HtmlFormatter(style=style_name).get_style_defs('.codehilite')
+
+
+@functools.lru_cache(maxsize=4)
+def _build_preview_shell(dark_mode: bool, pygments_css: str, custom_css: str) -> tuple:
+    """Return the (head, tail) HTML wrapped around the rendered preview body."""
+
+    if dark_mode:
+        body_bg = "#0d1117"
+        body_fg = "#c9d1d9"
+        border = "#30363d"
+        muted = "#8b949e"
+        link = "#2f81f7"
+        code_bg = "#161b22"
+    else:
+        body_bg = "#fff"
+        body_fg = "#333"
+        border = "#eaecef"
+        muted = "#6a737d"
+        link = "#0366d6"
+        code_bg = "#f6f8fa"
+
+    head = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <meta charset="UTF-8">
+        <style>
+            {pygments_css}
+            body {{
+                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+                line-height: 1.6;
+                color: {body_fg};
+                max-width: 800px;
+                margin: 0 auto;
+                padding: 20px;
+                background-color: {body_bg};
+            }}
+            h1, h2, h3, h4, h5, h6 {{
+                margin-top: 24px;
+                margin-bottom: 16px;
+                font-weight: 600;
+                line-height: 1.25;
+            }}
+            h1 {{ font-size: 2em; border-bottom: 1px solid {border}; padding-bottom: 0.3em; }}
+            h2 {{ font-size: 1.5em; border-bottom: 1px solid {border}; padding-bottom: 0.3em; }}
+            h3 {{ font-size: 1.25em; }}
+            h4 {{ font-size: 1em; }}
+            h5 {{ font-size: 0.875em; }}
+            h6 {{ font-size: 0.85em; color: {muted}; }}
+            p {{ margin-bottom: 16px; }}
+            code {{
+                background-color: {code_bg};
+                border-radius: 3px;
+                font-size: 85%;
+                margin: 0;
+                padding: 0.2em 0.4em;
+            }}
+            pre {{
+                background-color: {code_bg};
+                border-radius: 6px;
+                padding: 16px;
+                overflow: auto;
+                font-size: 85%;
+                line-height: 1.45;
+            }}
+            .codehilite {{
+                background-color: {code_bg};
+                border-radius: 6px;
+                padding: 16px;
+                overflow: auto;
+                margin-bottom: 16px;
+            }}
+            .codehilite pre {{
+                margin: 0;
+                padding: 0;
+                background: transparent;
+            }}
+            pre code {{
+                background-color: transparent;
+                border: 0;
+                display: inline;
+                line-height: inherit;
+                margin: 0;
+                max-width: auto;
+                overflow: visible;
+                padding: 0;
+                word-wrap: normal;
+            }}
+            blockquote {{
+                border-left: 0.25em solid {border};
+                color: {muted};
+                padding: 0 1em;
+                margin: 0 0 16px 0;
+            }}
+            table {{
+                border-spacing: 0;
+                border-collapse: collapse;
+                margin-bottom: 16px;
+            }}
+            table th, table td {{
+                border: 1px solid {border};
+                padding: 6px 13px;
+            }}
+            table th {{
+                background-color: {code_bg};
+                font-weight: 600;
+            }}
+            table tr:nth-child(2n) {{
+                background-color: {code_bg};
+            }}
+            ul, ol {{
+                padding-left: 2em;
+                margin-bottom: 16px;
+            }}
+            li {{
+                margin-bottom: 0.25em;
+            }}
+            a {{
+                color: {link};
+                text-decoration: none;
+            }}
+            a:hover {{
+                text-decoration: underline;
+            }}
+            img {{
+                max-width: 100%;
+                height: auto;
+            }}
+            hr {{
+                border: none;
+                border-top: 1px solid {border};
+                height: 1px;
+                margin: 24px 0;
+            }}
+            {custom_css}
+        </style>
+    </head>
+    <body>
+        <div id="content" data-smart-markdown-preview>
+        """
+    tail = """
+        </div>
+    </body>
+    </html>
+    """
+    return head, tail
+
+
+# Standalone documents written by the HTML export and the WeasyPrint PDF
+# export; only the page/body rules and the Pygments stylesheet differ.
+_EXPORT_HTML_TEMPLATE = string.Template("""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Exported Markdown Document</title>
+    <style>
+        $pygments_css
+        $page_css
+        $base_css
+    </style>
+</head>
+<body>
+    $body
+</body>
+</html>""")
+
+# Element styles shared by the HTML and PDF exports.
+_EXPORT_BASE_CSS = """h1, h2, h3, h4, h5, h6 {
+            margin-top: 24px;
+            margin-bottom: 16px;
+            font-weight: 600;
+            line-height: 1.25;
+        }
+        h1 { font-size: 2em; border-bottom: 1px solid #eaecef; padding-bottom: 0.3em; }
+        h2 { font-size: 1.5em; border-bottom: 1px solid #eaecef; padding-bottom: 0.3em; }
+        h3 { font-size: 1.25em; }
+        h4 { font-size: 1em; }
+        h5 { font-size: 0.875em; }
+        h6 { font-size: 0.85em; color: #6a737d; }
+        p { margin-bottom: 16px; }
+        code {
+            background-color: #f6f8fa;
+            border-radius: 3px;
+            font-size: 85%;
+            margin: 0;
+            padding: 0.2em 0.4em;
+        }
+        pre {
+            background-color: #f6f8fa;
+            border-radius: 6px;
+            padding: 16px;
+            overflow: auto;
+            font-size: 85%;
+            line-height: 1.45;
+        }
+        pre code {
+            background-color: transparent;
+            border: 0;
+            display: inline;
+            line-height: inherit;
+            margin: 0;
+            max-width: auto;
+            overflow: visible;
+            padding: 0;
+            word-wrap: normal;
+        }
+        blockquote {
+            border-left: 0.25em solid #dfe2e5;
+            color: #6a737d;
+            padding: 0 1em;
+            margin: 0 0 16px 0;
+        }
+        table {
+            border-spacing: 0;
+            border-collapse: collapse;
+            margin-bottom: 16px;
+        }
+        table th, table td {
+            border: 1px solid #dfe2e5;
+            padding: 6px 13px;
+        }
+        table th {
+            background-color: #f6f8fa;
+            font-weight: 600;
+        }
+        table tr:nth-child(2n) {
+            background-color: #f6f8fa;
+        }
+        ul, ol {
+            padding-left: 2em;
+            margin-bottom: 16px;
+        }
+        li {
+            margin-bottom: 0.25em;
+        }
+        a {
+            color: #0366d6;
+            text-decoration: none;
+        }
+        a:hover {
+            text-decoration: underline;
+        }
+        img {
+            max-width: 100%;
+            height: auto;
+        }
+        hr {
+            border: none;
+            border-top: 1px solid #eaecef;
+            height: 1px;
+            margin: 24px 0;
+        }"""
+
+_EXPORT_SCREEN_CSS = """body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #fff;
+        }"""
+
+_EXPORT_PRINT_CSS = """@page {
+            size: letter;
+            margin: 1in;
+        }
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            font-size: 12pt;
+        }"""
+
+
+def _build_export_html(html_body: str, *, for_pdf: bool = False) -> str:
+    """Wrap rendered Markdown in the standalone document used by the HTML and PDF exports."""
+
+    if for_pdf:
+        # Styles come from _weasyprint_stylesheet(), parsed once per process.
+        return _EXPORT_HTML_TEMPLATE.substitute(pygments_css="", page_css="", base_css="", body=html_body)
+    return _EXPORT_HTML_TEMPLATE.substitute(
+        pygments_css=_pygments_css("default"),
+        page_css=_EXPORT_SCREEN_CSS,
+        base_css=_EXPORT_BASE_CSS,
+        body=html_body,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _weasyprint_stylesheet():
+    """Return the PDF export stylesheet as a weasyprint.CSS, reused across exports."""
+
+    import weasyprint
+
+    return weasyprint.CSS(string=_EXPORT_PRINT_CSS + "\n" + _EXPORT_BASE_CSS)
+
+
+def _thread_markdown() -> markdown.Markdown:
+    """Return the calling thread's reusable Markdown converter for preview and export."""
+
+    md = getattr(_markdown_local, 'md', None)
+    if md is None:
+        md = markdown.Markdown(extensions=['codehilite', 'tables', 'toc'])
+        _markdown_local.md = md
+    return md
+
+
+def _render_preview_html(markdown_text: str, block_cache: dict) -> tuple:
+    """Render the preview body, reusing cached HTML for unchanged top-level blocks.
+
+    Returns the HTML and the block cache for the rendered text; block_cache
+    itself is only read, so it can be shared with a worker thread.
+    """
+
+    md = _thread_markdown()
+    chunks = _RE_PREVIEW_BLOCK_SPLIT.split(markdown_text)
+    # Reference links, raw HTML, [TOC] markers and a whitespace-only
+    # leading block all render differently in isolation.
+    if chunks[0].isspace() or _RE_PREVIEW_WHOLE_DOC.search(markdown_text):
+        return md.reset().convert(markdown_text), {}
+
+    blocks = {}
+    parts = []
+    for block in chunks:
+        html = blocks.get(block)
+        if html is None:
+            html = block_cache.get(block)
+            if html is None:
+                html = md.reset().convert(block)
+                # convert() strips the newline a trailing code block keeps
+                # in a full render; put it back so the fragments join alike.
+                # Fenced blocks are stashed before indented ones, so the
+                # block that ends the fragment need not be the last stashed.
+                if html:
+                    for raw in reversed(md.htmlStash.rawHtmlBlocks):
+                        if isinstance(raw, str) and html.endswith(raw.rstrip()):
+                            html += raw[len(raw.rstrip()):]
+                            break
+            blocks[block] = html
+        if html:
+            parts.append(html)
+    # Only the blocks of this text are kept, so the cache cannot grow.
+    html = "\n".join(parts).rstrip()
+
+    # Heading ids are made unique across the whole document by the toc
+    # extension, so duplicated headings need a full render.
+    ids = _RE_HEADING_ID.findall(html)
+    if len(ids) != len(set(ids)):
+        return md.reset().convert(markdown_text), blocks
+    return html, blocks
+
+
+def _write_text_file(file_path: str, text: str) -> None:
+    """Write text as UTF-8 in one binary write, keeping text-mode line endings."""
+
+    data = text.encode('utf-8')
+    if os.linesep != '\n':
+        data = data.replace(b'\n', os.linesep.encode('ascii'))
+    with open(file_path, 'wb') as file:
+        file.write(data)
+
+
+def _text_digest(text: str) -> bytes:
+    """Return a content digest used to detect saves that would not change the file."""
+
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+def _plain_text_replacement(match) -> str:
+    """Replace one _RE_PLAIN_TEXT_MARKUP match with its plain-text content."""
+
+    group = match.lastindex
+    if group is None:
+        return ''
+    text = match.group(group)
+    if group in (3, 4):
+        return text
+    # Emphasis and link text may themselves contain markup.
+    if '*' in text or '`' in text or '[' in text or '#' in text:
+        text = _RE_PLAIN_TEXT_MARKUP.sub(_plain_text_replacement, text)
+    return f'[{text}]' if group == 5 else text
+
+
+def _render_inline(line: str, markup: dict) -> str:
+    """Replace bold, italic, code and link spans in a line with a format's markup."""
+
+    # Most prose lines carry no markup at all; skip the regex pass for them.
+    if '*' not in line and '`' not in line and '[' not in line:
+        return line
+
+    def replace(match):
+        kind = match.lastgroup
+        if kind is None:
+            return ''
+        text = match.group(kind)
+        # Spans may nest further markup, including inside code as before.
+        if '*' in text or '`' in text or '[' in text:
+            text = _RE_INLINE_MARKUP.sub(replace, text)
+        opening, closing = markup[kind]
+        return opening + text + closing
+
+    return _RE_INLINE_MARKUP.sub(replace, line)
+
+
+def _rtf_escape(text: str) -> str:
+    """Escape the characters RTF treats as control syntax."""
+
+    # Chained replace beats str.translate here: each call returns the string
+    # itself when the character is absent, and translate's one-to-many path
+    # is several times slower on non-ASCII text.
+    return text.replace('\\', '\\\\').replace('{', '\\{').replace('}', '\\}')
+
+
+def _heading_level(line: str) -> int:
+    """Return the level of an ATX heading line ('#'..'######' plus a space), else 0."""
+
+    level = len(line) - len(line.lstrip('#'))
+    if 0 < level <= 6 and line[level:level + 1] == ' ':
+        return level
+    return 0
+
+
+def _iter_markdown_blocks(markdown_text: str):
+    """Classify a document line by line for the DOCX/PDF/RTF/ODT exporters.
+
+    Yields ``(kind, value)`` pairs: ``('code', lines)``, ``('heading', (level, text))``,
+    ``('rule', '')``, ``('bullet', text)``, ``('numbered', text)``, ``('blank', '')``
+    and ``('paragraph', line)``. Empty or unterminated code fences yield nothing.
+    """
+
+    in_code_block = False
+    code_content = []
+
+    for line in markdown_text.split('\n'):
+        stripped = line.strip()
+        if stripped.startswith('```'):
+            if in_code_block:
+                if code_content:
+                    yield 'code', code_content
+                    code_content = []
+                in_code_block = False
+            else:
+                in_code_block = True
+            continue
+
+        if in_code_block:
+            code_content.append(line)
+            continue
+
+        # Only lines starting with '#' can be headings; skip the call otherwise.
+        level = _heading_level(line) if line[:1] == '#' else 0
+        if level:
+            yield 'heading', (level, line[level + 1:])
+        elif stripped in ('---', '***'):
+            yield 'rule', ''
+        elif stripped.startswith(('- ', '* ', '+ ')):
+            yield 'bullet', stripped[2:]
+        elif _RE_LIST_OL.match(stripped):
+            yield 'numbered', stripped
+        elif not stripped:
+            yield 'blank', ''
+        else:
+            yield 'paragraph', line
+
+
+def _export_text(markdown_text: str, file_path: str) -> None:
+    """Write a markdown document to a plain-text file with the markup stripped."""
+
+    text = _RE_PLAIN_TEXT_MARKUP.sub(_plain_text_replacement, markdown_text)
+
+    _write_text_file(file_path, text)
+
+
+def _export_html(markdown_text: str, file_path: str) -> None:
+    """Write a markdown document to a standalone HTML file."""
+
+    html = _thread_markdown().reset().convert(markdown_text)
+
+    styled_html = _build_export_html(html)
+
+    with open(file_path, 'w', encoding='utf-8') as file:
+        file.write(styled_html)
+
+
+def _export_docx(markdown_text: str, file_path: str) -> None:
+    """Write a markdown document to a Word file with python-docx."""
+
+    if not DOCX_AVAILABLE:
+        raise ImportError("python-docx library is not available")
+
+    from docx import Document
+
+    doc = Document()
+
+
+    doc.add_heading('Exported Markdown Document', 0)
+
+
+    for kind, value in _iter_markdown_blocks(markdown_text):
+        if kind == 'code':
+            paragraph = doc.add_paragraph()
+            run = paragraph.add_run('\n'.join(value))
+            run.font.name = 'Courier New'
+
+        elif kind == 'heading':
+            level, heading = value
+            doc.add_heading(heading, level=level)
+
+        elif kind == 'rule':
+            doc.add_paragraph('_' * 50)
+
+        elif kind == 'bullet':
+            doc.add_paragraph(value, style='List Bullet')
+        elif kind == 'numbered':
+            doc.add_paragraph(_RE_LIST_OL.sub('', value, count=1), style='List Number')
+
+        elif kind == 'blank':
+            doc.add_paragraph()
+
+        else:
+            doc.add_paragraph(_render_inline(value, _PLAIN_INLINE_MARKUP))
+
+    doc.save(file_path)
+
+
+def _export_pdf(markdown_text: str, file_path: str) -> None:
+    """Write a markdown document to PDF via weasyprint, falling back to reportlab."""
+
+    weasyprint = None
+    if WEASYPRINT_AVAILABLE:
+        try:
+            import weasyprint
+        except (ImportError, OSError):
+            # Installed but unusable, e.g. without its Pango system libraries.
+            weasyprint = None
+
+    if weasyprint is not None:
+        html = _thread_markdown().reset().convert(markdown_text)
+
+        styled_html = _build_export_html(html, for_pdf=True)
+
+
+        weasyprint.HTML(string=styled_html).write_pdf(
+            file_path, stylesheets=[_weasyprint_stylesheet()])
+
+
+    elif PDF_AVAILABLE:
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.styles import getSampleStyleSheet
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+
+        doc = SimpleDocTemplate(file_path, pagesize=letter)
+        styles = getSampleStyleSheet()
+        story = []
+
+
+        title_style = styles['Title']
+        title = Paragraph("Exported Markdown Document", title_style)
+        story.append(title)
+        story.append(Spacer(1, 12))
+
+
+        # Styles and the append method are bound once rather than looked up per line.
+        append = story.append
+        normal_style = styles['Normal']
+        code_style = styles['Code']
+        heading_styles = (None,) + tuple(styles[f'Heading{level}'] for level in range(1, 7))
+
+        for kind, value in _iter_markdown_blocks(markdown_text):
+            if kind == 'code':
+                append(Paragraph('\n'.join(value), code_style))
+                append(Spacer(1, 6))
+
+            elif kind == 'heading':
+                level, heading = value
+                append(Paragraph(heading, heading_styles[level]))
+
+            elif kind == 'rule':
+                append(Spacer(1, 12))
+
+            elif kind == 'bullet':
+                append(Paragraph(f"• {value}", normal_style))
+            elif kind == 'numbered':
+                append(Paragraph(value, normal_style))
+
+            elif kind == 'blank':
+                append(Spacer(1, 6))
+
+            else:
+                append(Paragraph(_render_inline(value, _PDF_INLINE_MARKUP), normal_style))
+
+        doc.build(story)
+
+    else:
+        raise ImportError("Neither weasyprint nor reportlab is available")
+
+
+def _export_rtf(markdown_text: str, file_path: str) -> None:
+    """Write a markdown document to an RTF file."""
+
+    # Each fragment goes straight to the file, so the document is never
+    # held in memory a second time.
+    with open(file_path, 'w', encoding='utf-8') as file:
+        write = file.write
+        write(r"{\rtf1\ansi\deff0")
+        write(r"{\fonttbl{\f0 Times New Roman;}{\f1 Courier New;}}")
+        write(r"{\colortbl;\red0\green0\blue0;}")
+        write(r"\fs24")
+
+        for kind, value in _iter_markdown_blocks(markdown_text):
+            if kind == 'code':
+                write(r"{\pard\plain\f0\fs20 ")
+                for code_line in value:
+                    write(_rtf_escape(code_line) + r"\line ")
+                write(r"}\par")
+
+            elif kind == 'heading':
+                level, heading = value
+                write(r"{\pard\plain\f0\fs" + _RTF_HEADING_SIZES[level] + r"\b " + _rtf_escape(heading) + r"}\par")
+
+            elif kind == 'rule':
+                write(r"{\pard\plain\f0\fs24 " + "_" * 50 + r"}\par")
+
+            elif kind == 'bullet':
+                write(r"{\pard\plain\f0\fs24 \bullet " + _rtf_escape(value) + r"}\par")
+            elif kind == 'numbered':
+                write(r"{\pard\plain\f0\fs24 " + _rtf_escape(value) + r"}\par")
+
+            elif kind == 'blank':
+                write(r"\par")
+
+            else:
+                processed_line = _render_inline(_rtf_escape(value), _RTF_INLINE_MARKUP)
+                write(r"{\pard\plain\f0\fs24 " + processed_line + r"}\par")
+
+        write("}")
+
+
+def _export_odt(markdown_text: str, file_path: str) -> None:
+    """Write a markdown document to an OpenDocument text file."""
+
+    import io
+    import zipfile
+    from xml.sax.saxutils import escape
+
+    with zipfile.ZipFile(file_path, 'w', zipfile.ZIP_DEFLATED) as odt:
+
+        # ODF requires the mimetype entry first and uncompressed.
+        odt.writestr('mimetype', _ODT_MIMETYPE, compress_type=zipfile.ZIP_STORED)
+
+
+        # content.xml is emitted as escaped fragments straight into the
+        # archive member; a tree of one Element per line is never built.
+        with io.TextIOWrapper(odt.open('content.xml', 'w'), encoding='utf-8',
+                              errors='xmlcharrefreplace') as content_file:
+            write = content_file.write
+            write(_ODT_CONTENT_HEADER)
+
+            for kind, value in _iter_markdown_blocks(markdown_text):
+                if kind == 'code':
+                    for code_line in value:
+                        write(f"<text:p>{escape(code_line)}</text:p>")
+
+                elif kind == 'heading':
+                    level, heading = value
+                    write(f'<text:h text:outline-level="{level}">{escape(heading)}</text:h>')
+
+                elif kind == 'rule':
+                    write("<text:p>" + "_" * 50 + "</text:p>")
+
+                elif kind == 'bullet':
+                    write(f"<text:p>• {escape(value)}</text:p>")
+                elif kind == 'numbered':
+                    write(f"<text:p>{escape(value)}</text:p>")
+
+                elif kind == 'blank':
+                    write("<text:p />")
+
+                else:
+                    write(f"<text:p>{escape(_render_inline(value, _PLAIN_INLINE_MARKUP))}</text:p>")
+
+            write(_ODT_CONTENT_FOOTER)
+
+        odt.writestr('META-INF/manifest.xml', _ODT_MANIFEST)
+
+
+# Formats slow enough to render off the GUI thread; each takes (markdown_text, file_path).
+_BACKGROUND_EXPORTERS = {
+    'html': _export_html,
+    'docx': _export_docx,
+    'pdf': _export_pdf,
+    'rtf': _export_rtf,
+    'odt': _export_odt,
+}
+
+
 class MarkdownSyntaxHighlighter(QSyntaxHighlighter):
     """Basic Markdown syntax highlighting for the editor."""
 
@@ -62,8 +870,17 @@ class MarkdownSyntaxHighlighter(QSyntaxHighlighter):
         super().__init__(document)
         self._dark_mode = bool(dark_mode)
         self._rule_formats = []
-        self._fence_re = QRegularExpression(r"^\s{0,3}(```|~~~)")
+        self._inline_re = QRegularExpression(
+            r"(?<code>`[^`\n]+`)"
+            r"|(?<bold>\*\*[^\*\n]+\*\*|__[^_\n]+__)"
+            r"|(?<italic>(?<!\*)\*[^\*\n]+\*(?!\*)|(?<!_)_[^_\n]+_(?!_))"
+            r"|(?<linktext>\[[^\]]+\](?=\())"
+            r"|(?<url>\([^\)\s]+\))"
+        )
+        self._inline_re.optimize()
+        self._inline_formats = ()
         self._codeblock_format = QTextCharFormat()
+        self._format_tables = {}
         self._build_formats()
 
     def set_dark_mode(self, dark_mode: bool) -> None:
@@ -75,6 +892,12 @@ class MarkdownSyntaxHighlighter(QSyntaxHighlighter):
         self.rehighlight()
 
     def _build_formats(self) -> None:
+        # Each theme's formats are built once; toggling back reuses them.
+        cached = self._format_tables.get(self._dark_mode)
+        if cached is not None:
+            self._rule_formats, self._inline_formats, self._codeblock_format = cached
+            return
+
         self._rule_formats = []
 
         if self._dark_mode:
@@ -97,59 +920,69 @@ class MarkdownSyntaxHighlighter(QSyntaxHighlighter):
         heading_format = QTextCharFormat()
         heading_format.setForeground(heading_color)
         heading_format.setFontWeight(QFont.Bold)
-        self._add_rule(r"^\s{0,3}#{1,6} .*", heading_format)
+        self._add_rule(r"^\s{0,3}#{1,6} .*", heading_format, lambda t: '#' in t[:4])
 
         blockquote_format = QTextCharFormat()
         blockquote_format.setForeground(muted_color)
-        self._add_rule(r"^\s{0,3}>\s.*", blockquote_format)
+        self._add_rule(r"^\s{0,3}>\s.*", blockquote_format, lambda t: '>' in t[:4])
 
         list_marker_format = QTextCharFormat()
         list_marker_format.setForeground(muted_color)
         list_marker_format.setFontWeight(QFont.Bold)
-        self._add_rule(r"^\s{0,3}([-*+])\s+", list_marker_format)
-        self._add_rule(r"^\s{0,3}(\d+)\.\s+", list_marker_format)
+        self._add_rule(r"^\s{0,3}[-*+]\s+", list_marker_format, lambda t: t[:4].lstrip()[:1] in ('-', '*', '+'))
+        self._add_rule(r"^\s{0,3}\d+\.\s+", list_marker_format, lambda t: t[:4].lstrip()[:1].isdigit())
 
         hr_format = QTextCharFormat()
         hr_format.setForeground(rule_color)
-        self._add_rule(r"^\s{0,3}(-{3,}|\*{3,}|_{3,})\s*$", hr_format)
+        self._add_rule(r"^\s{0,3}(?:-{3,}|\*{3,}|_{3,})\s*$", hr_format, lambda t: t[:4].lstrip()[:1] in ('-', '*', '_'))
+
+        inline_code_format = QTextCharFormat()
+        inline_code_format.setForeground(code_fg)
+        inline_code_format.setBackground(code_bg)
 
         bold_format = QTextCharFormat()
         bold_format.setFontWeight(QFont.Bold)
-        self._add_rule(r"\*\*[^\*\n]+\*\*", bold_format)
-        self._add_rule(r"__[^_\n]+__", bold_format)
 
         italic_format = QTextCharFormat()
         italic_format.setFontItalic(True)
 
-        self._add_rule(r"(?<!\*)\*[^\*\n]+\*(?!\*)", italic_format)
-        self._add_rule(r"(?<!_)_[^_\n]+_(?!_)", italic_format)
-
-        inline_code_format = QTextCharFormat()
-        inline_code_format.setForeground(code_fg)
-        inline_code_format.setBackground(code_bg)
-        self._add_rule(r"`[^`\n]+`", inline_code_format)
-
         link_text_format = QTextCharFormat()
         link_text_format.setForeground(link_color)
-        self._add_rule(r"\[[^\]]+\](?=\()", link_text_format)
 
         link_url_format = QTextCharFormat()
         link_url_format.setForeground(url_color)
-        self._add_rule(r"\([^\)\s]+\)", link_url_format)
+
+        # Group numbers index into _inline_formats.
+        self._inline_formats = (
+            None,
+            inline_code_format,
+            bold_format,
+            italic_format,
+            link_text_format,
+            link_url_format,
+        )
+
+        # Rules are fixed once built; a tuple keeps the per-block loop lean.
+        self._rule_formats = tuple(self._rule_formats)
 
         self._codeblock_format = QTextCharFormat()
         self._codeblock_format.setForeground(code_fg if self._dark_mode else QColor("#24292f"))
         self._codeblock_format.setBackground(code_bg)
         self._codeblock_format.setFontFamily("SF Mono")
 
-    def _add_rule(self, pattern: str, fmt: QTextCharFormat) -> None:
-        self._rule_formats.append((QRegularExpression(pattern), fmt))
+        self._format_tables[self._dark_mode] = (self._rule_formats, self._inline_formats, self._codeblock_format)
+
+    def _add_rule(self, pattern: str, fmt: QTextCharFormat, prefilter) -> None:
+        # Only the overall match span is used, so skip capture bookkeeping.
+        regex = QRegularExpression(pattern, QRegularExpression.DontCaptureOption)
+        regex.optimize()
+        self._rule_formats.append((prefilter, regex, fmt))
 
     def highlightBlock(self, text: str) -> None:
         in_code_block = self.previousBlockState() == 1
 
-        fence_match = self._fence_re.match(text)
-        is_fence_line = fence_match.hasMatch()
+        stripped = text.lstrip(_FENCE_INDENT_CHARS)
+        is_fence_line = len(text) - len(stripped) <= 3 and stripped.startswith(('```', '~~~'))
 
         if in_code_block:
             self.setFormat(0, len(text), self._codeblock_format)
@@ -165,14 +998,41 @@ class MarkdownSyntaxHighlighter(QSyntaxHighlighter):
             return
 
         self.setCurrentBlockState(0)
-        for regex, fmt in self._rule_formats:
+        set_format = self.setFormat
+        for prefilter, regex, fmt in self._rule_formats:
+            if not prefilter(text):
+                continue
             it = regex.globalMatch(text)
             while it.hasNext():
                 match = it.next()
                 start = match.capturedStart()
                 length = match.capturedLength()
                 if length > 0:
-                    self.setFormat(start, length, fmt)
+                    set_format(start, length, fmt)
+
+        self._highlight_inline(text, 0)
+
+    def _highlight_inline(self, text: str, offset: int) -> None:
+        if not any(c in text for c in _INLINE_MARKERS):
+            return
+
+        set_format = self.setFormat
+        inline_formats = self._inline_formats
+        it = self._inline_re.globalMatch(text)
+        while it.hasNext():
+            match = it.next()
+            start = match.capturedStart()
+            length = match.capturedLength()
+            if length <= 0:
+                continue
+            group = match.lastCapturedIndex()
+            set_format(offset + start, length, inline_formats[group])
+
+            # Emphasis may wrap code spans and links; highlight those on top.
+            if group == _INLINE_BOLD:
+                self._highlight_inline(text[start + 2:start + length - 2], offset + start + 2)
+            elif group == _INLINE_ITALIC:
+                self._highlight_inline(text[start + 1:start + length - 1], offset + start + 1)
 
 
 class MarkdownAnalyzer:
@@ -180,15 +1040,18 @@ class MarkdownAnalyzer:
 
     def __init__(self, text):
         self.text = text
-        self.lines = text.split('\n')
+        self.line_count = text.count('\n') + 1
+        self._scanned = False
+        self._word_count = None
 
     def analyze(self):
         """Perform analysis and return a metrics dictionary."""
 
+        self._scan_lines()
         return {
             'word_count': self._count_words(),
             'char_count': len(self.text),
-            'line_count': len(self.lines),
+            'line_count': self.line_count,
             'reading_time': self._estimate_reading_time(),
             'headings': self._analyze_headings(),
             'links': self._analyze_links(),
@@ -205,13 +1068,146 @@ class MarkdownAnalyzer:
     def _count_words(self):
         """Count words in the document, excluding code blocks."""
 
+        # Reading time and readability reuse the count from analyze().
+        if self._word_count is not None:
+            return self._word_count
+
+        text = self.text
+        # ASCII text is classified byte-wise in C: word characters become 'w'
+        # and everything else ' ', so each word starts at a ' w' pair.
+        classes = text.encode('ascii').translate(_ASCII_WORD_CLASSES) if text.isascii() else None
+        count = 0
+        prev_ends_in_word = False
+        for start, end in self._prose_ranges():
+            if start == end:
+                continue
+            if classes is not None:
+                count += classes.count(b' w', start, end) + (classes[start] == 0x77)
+            else:
+                count += len(_RE_WORD.findall(text, start, end))
+
+            # Removing code joins the surrounding text, so a word split by a
+            # code span counts once.
+            first = text[start]
+            if prev_ends_in_word and (first.isalnum() or first == '_'):
+                count -= 1
+            last = text[end - 1]
+            prev_ends_in_word = last.isalnum() or last == '_'
+        self._word_count = count
+        return count
+
+    def _prose_ranges(self):
+        """Return (start, end) spans of the text outside fenced and inline code."""
+
+        text = self.text
+        fence_free = []
+        pos = 0
+        while True:
+            start = text.find('```', pos)
+            if start == -1:
+                break
+            end = text.find('```', start + 3)
+            if end == -1:
+                break
+            fence_free.append((pos, start))
+            pos = end + 3
+        fence_free.append((pos, len(text)))
+
+        # Inline code is matched against the text with fences already removed,
+        # so backtick adjacency is tracked in that virtual string while the
+        # cuts are recorded as positions in the original text.
+        cuts = []
+        open_virtual = None
+        open_pos = None
+        offset = 0
+        for start, end in fence_free:
+            tick = text.find('`', start, end)
+            while tick != -1:
+                virtual = offset + tick - start
+                if open_virtual is None or virtual == open_virtual + 1:
+                    open_virtual = virtual
+                    open_pos = tick
+                else:
+                    cuts.append((open_pos, tick + 1))
+                    open_virtual = None
+                tick = text.find('`', tick + 1, end)
+            offset += end - start
+
+        if not cuts:
+            return fence_free
+
+        ranges = []
+        cut_index = 0
+        for start, end in fence_free:
+            cursor = start
+            while cut_index < len(cuts) and cuts[cut_index][0] < end:
+                cut_start, cut_end = cuts[cut_index]
+                if cut_start > cursor:
+                    ranges.append((cursor, cut_start))
+                cursor = max(cursor, cut_end)
+                if cut_end > end:
+                    break
+                cut_index += 1
+            if cursor < end:
+                ranges.append((cursor, end))
+        return ranges
+
+    def _scan_lines(self):
+        """Collect all per-line metrics in a single pass over the document."""
+
+        if self._scanned:
+            return
+
+        headings = {'h1': 0, 'h2': 0, 'h3': 0, 'h4': 0, 'h5': 0, 'h6': 0}
+        seen_headings = set()
+        duplicate_headings = set()
+        list_count = 0
+        quote_count = 0
+        table_count = 0
+        long_lines = 0
+        in_table = False
 
-        text_without_code = re.sub(r'```.*?```', '', self.text, flags=re.DOTALL)
+        # The line list only lives for the duration of the scan.
+        for line in self.text.split('\n'):
+            stripped = line.strip()
+            first = stripped[:1]
+            if first == '|':
+                if not in_table:
+                    table_count += 1
+                    in_table = True
+                continue
 
-        text_without_code = re.sub(r'`[^`]+`', '', text_without_code)
+            in_table = False
+            if len(line) > 120:
+                long_lines += 1
 
-        words = re.findall(r'\b\w+\b', text_without_code)
-        return len(words)
+            if not first:
+                continue
+            if first == '#':
+                level = len(stripped) - len(stripped.lstrip('#'))
+                if level <= 6 and stripped[level:level + 1].isspace():
+                    headings[f'h{level}'] += 1
+                    heading_text = stripped[level:].lstrip()
+                    if heading_text in seen_headings:
+                        duplicate_headings.add(heading_text)
+                    else:
+                        seen_headings.add(heading_text)
+            elif first == '>':
+                quote_count += 1
+            elif first in '-*+':
+                if line.lstrip()[1:2].isspace():
+                    list_count += 1
+            elif first.isdigit():
+                if _RE_LIST_OL.match(line):
+                    list_count += 1
+
+        self._headings = headings
+        self._duplicate_headings = duplicate_headings
+        self._list_count = list_count
+        self._quote_count = quote_count
+        self._table_count = table_count
+        self._long_lines = long_lines
+        self._scanned = True
 
     def _estimate_reading_time(self):
         """Estimate reading time in minutes (average 200 words/min)."""
@@ -222,64 +1218,47 @@ class MarkdownAnalyzer:
     def _analyze_headings(self):
         """Analyze heading structure (H1-H6 counts)."""
 
-        headings = {'h1': 0, 'h2': 0, 'h3': 0, 'h4': 0, 'h5': 0, 'h6': 0}
-        for line in self.lines:
-            match = re.match(r'^(#{1,6})\s+(.+)$', line.strip())
-            if match:
-                level = len(match.group(1))
-                headings[f'h{level}'] += 1
-        return headings
+        self._scan_lines()
+        return self._headings
 
     def _analyze_links(self):
         """Count markdown links."""
 
-
-        links = re.findall(r'\[([^\]]+)\]\(([^\)]+)\)', self.text)
+        # Every link contains '](', so documents without one skip the regex.
+        if '](' not in self.text:
+            return 0
+        links = _RE_LINK.findall(self.text)
         return len(links)
 
     def _count_images(self):
         """Count markdown images."""
 
-
-        images = re.findall(r'!\[([^\]]*)\]\(([^\)]+)\)', self.text)
+        if '![' not in self.text:
+            return 0
+        images = _RE_IMAGE.findall(self.text)
         return len(images)
 
     def _count_code_blocks(self):
         """Count fenced code blocks."""
 
-        code_blocks = re.findall(r'```', self.text)
-        return len(code_blocks) // 2
+        return self.text.count('```') // 2
 
     def _count_lists(self):
         """Count list items (ordered and unordered)."""
 
-        list_items = 0
-        for line in self.lines:
-            if re.match(r'^\s*[-*+]\s+', line) or re.match(r'^\s*\d+\.\s+', line):
-                list_items += 1
-        return list_items
+        self._scan_lines()
+        return self._list_count
 
     def _count_blockquotes(self):
         """Count blockquote lines."""
 
-        quotes = sum(1 for line in self.lines if line.strip().startswith('>'))
-        return quotes
+        self._scan_lines()
+        return self._quote_count
 
     def _count_tables(self):
         """Count markdown tables (heuristic based)."""
-
-
-        in_table = False
-        table_count = 0
-        for line in self.lines:
-            if '|' in line and line.strip().startswith('|'):
-                if not in_table:
-                    table_count += 1
-                    in_table = True
-            else:
-                if in_table and not line.strip().startswith('|'):
-                    in_table = False
-        return table_count
+        self._scan_lines()
+        return self._table_count
 
     def _calculate_readability(self):
         """Calculate a simple readability score (0-100)."""
@@ -287,8 +1266,10 @@ class MarkdownAnalyzer:
         score = 100
 
 
-        paragraphs = self.text.split('\n\n')
-        avg_paragraph_length = sum(len(p.split()) for p in paragraphs) / max(len(paragraphs), 1)
+        # '\n\n' is whitespace, so splitting the whole text yields the same
+        # words as splitting each paragraph without building the paragraphs.
+        paragraph_count = self.text.count('\n\n') + 1
+        avg_paragraph_length = len(self.text.split()) / paragraph_count
         if avg_paragraph_length > 100:
             score -= 10
         elif avg_paragraph_length > 150:
@@ -328,29 +1309,98 @@ class MarkdownAnalyzer:
         issues = []
 
 
-        empty_links = re.findall(r'\[([^\]]+)\]\(\s*\)', self.text)
+        empty_links = _RE_EMPTY_LINK.findall(self.text) if '](' in self.text else ()
         if empty_links:
             issues.append(f"{len(empty_links)} empty link(s)")
 
 
-        headings_text = []
-        for line in self.lines:
-            match = re.match(r'^#{1,6}\s+(.+)$', line.strip())
-            if match:
-                headings_text.append(match.group(1))
-
-        duplicates = [h for h, count in Counter(headings_text).items() if count > 1]
+        self._scan_lines()
+        duplicates = self._duplicate_headings
         if duplicates:
             issues.append(f"{len(duplicates)} duplicate heading(s)")
 
 
-        long_lines = sum(1 for line in self.lines if len(line) > 120 and not line.strip().startswith('|'))
+        long_lines = self._long_lines
         if long_lines > 5:
             issues.append(f"{long_lines} very long lines")
 
         return issues if issues else ["No issues detected"]
 
 
+class _AnalysisSignals(QObject):
+    """Carries analysis results from worker threads back to the GUI thread."""
+
+    finished = Signal(int, object, object)
+
+
+class _AnalysisTask(QRunnable):
+    """Run MarkdownAnalyzer on a text snapshot in the global thread pool."""
+
+    def __init__(self, epoch, cache_key, text, signals):
+        super().__init__()
+        self._epoch = epoch
+        self._cache_key = cache_key
+        self._text = text
+        self._signals = signals
+
+    def run(self):
+        try:
+            metrics = MarkdownAnalyzer(self._text).analyze()
+        except Exception:
+            metrics = None
+        self._signals.finished.emit(self._epoch, self._cache_key, metrics)
+
+
+class _PreviewSignals(QObject):
+    """Carries rendered preview HTML from worker threads back to the GUI thread."""
+
+    finished = Signal(int, object, object, object)
+
+
+class _PreviewRenderTask(QRunnable):
+    """Render a preview text snapshot to HTML in the global thread pool."""
+
+    def __init__(self, epoch, cache_key, text, block_cache, signals):
+        super().__init__()
+        self._epoch = epoch
+        self._cache_key = cache_key
+        self._text = text
+        self._block_cache = block_cache
+        self._signals = signals
+
+    def run(self):
+        try:
+            html, blocks = _render_preview_html(self._text, self._block_cache)
+        except Exception:
+            html, blocks = None, self._block_cache
+        self._signals.finished.emit(self._epoch, self._cache_key, html, blocks)
+
+
+class _ExportSignals(QObject):
+    """Reports background export results back to the GUI thread."""
+
+    finished = Signal(str, str)
+
+
+class _ExportTask(QRunnable):
+    """Run one module-level exporter on a text snapshot in the global thread pool."""
+
+    def __init__(self, exporter, markdown_text, file_path, signals):
+        super().__init__()
+        self._exporter = exporter
+        self._markdown_text = markdown_text
+        self._file_path = file_path
+        self._signals = signals
+
+    def run(self):
+        try:
+            self._exporter(self._markdown_text, self._file_path)
+        except Exception as e:
+            self._signals.finished.emit(self._file_path, str(e))
+        else:
+            self._signals.finished.emit(self._file_path, "")
+
+
 class MarkdownEditor(QMainWindow):
     """Main application window providing editor, preview, and assistant panels."""
     def __init__(self):
@@ -359,19 +1409,54 @@ class MarkdownEditor(QMainWindow):
         self.setGeometry(100, 100, 1400, 900)
 
         self._settings = QSettings("smart-markdown-editor", "MarkdownEditor")
+
+        self._pending_settings = {}
+        self._settings_flush_timer = QTimer()
+        self._settings_flush_timer.setSingleShot(True)
+        self._settings_flush_timer.setInterval(500)
+        self._settings_flush_timer.timeout.connect(self._flush_settings)
+
         self._dark_mode = bool(self._settings.value("darkMode", False, type=bool))
 
         self.current_file = None
+        self._last_saved_digest = None
 
 
         self._custom_preview_css_path = self._settings.value("previewCssPath", "", type=str)
         self._custom_preview_css_cache = ""
         self._custom_preview_css_cache_mtime = None
+        self._custom_preview_css_recheck_at = 0.0
 
 
         self._recent_files = self._load_recent_files()
 
-        self._pygments_css_by_theme = {"light": None, "dark": None}
+        self._analysis_cache = {}
+        self._preview_html_cache = {}
+        self._preview_block_cache = {}
+
+        self._preview_epoch = 0
+        self._preview_rendering = False
+        self._preview_render_pending = False
+        self._preview_signals = _PreviewSignals(self)
+        self._preview_signals.finished.connect(self._on_preview_rendered)
+
+        self._analysis_epoch = 0
+        self._shown_metrics = None
+        self._analysis_signals = _AnalysisSignals(self)
+        self._analysis_signals.finished.connect(self._on_analysis_finished)
+
+        self._export_signals = _ExportSignals(self)
+        self._export_signals.finished.connect(self._on_export_finished)
+
+        self._text_version = 0
+        self._last_keystroke_at = 0.0
+        self._text_snapshot = ""
+        self._text_snapshot_version = -1
+
+        self._preview_shell = None
+        self._preview_body = ""
+        self._preview_loading_body = ""
+        self._preview_dom_body = None
 
 
         self.init_ui()
@@ -405,7 +1490,7 @@ class MarkdownEditor(QMainWindow):
         main_splitter = QSplitter(Qt.Horizontal)
 
 
-        self.editor = QTextEdit()
+        self.editor = QPlainTextEdit()
         self.editor.setPlaceholderText("Type your markdown here...")
         self.editor.textChanged.connect(self.on_text_changed)
 
@@ -414,6 +1499,7 @@ class MarkdownEditor(QMainWindow):
 
 
         self.preview = QWebEngineView()
+        self.preview.loadFinished.connect(self._on_preview_load_finished)
 
 
         self.assistant_panel = self.create_assistant_panel()
@@ -544,6 +1630,8 @@ class MarkdownEditor(QMainWindow):
 
         self.recent_files_menu = file_menu.addMenu("Recent Files")
         self._rebuild_recent_files_menu()
+        # Refresh only when the menu is opened, not on every open/save.
+        self.recent_files_menu.aboutToShow.connect(self._rebuild_recent_files_menu)
 
 
         save_action = file_menu.addAction("Save")
@@ -584,6 +1672,11 @@ class MarkdownEditor(QMainWindow):
         export_odt_action = export_menu.addAction("OpenDocument Text (.odt)")
         export_odt_action.triggered.connect(lambda: self.export_file('odt'))
 
+        export_menu.addSeparator()
+
+        export_all_action = export_menu.addAction("All Formats...")
+        export_all_action.triggered.connect(self.export_all_formats)
+
         file_menu.addSeparator()
 
 
@@ -824,7 +1917,7 @@ class MarkdownEditor(QMainWindow):
 
     def toggle_dark_mode(self, checked: bool):
         self._dark_mode = bool(checked)
-        self._settings.setValue("darkMode", self._dark_mode)
+        self._queue_setting("darkMode", self._dark_mode)
         self.apply_theme()
         self.update_preview()
 
@@ -837,7 +1930,7 @@ class MarkdownEditor(QMainWindow):
             selection_fg = "#ffffff"
 
             self.editor.setStyleSheet(f"""
-                QTextEdit {{
+                QPlainTextEdit {{
                     background-color: {editor_bg};
                     color: {editor_fg};
                     border: 1px solid {border};
@@ -871,7 +1964,7 @@ class MarkdownEditor(QMainWindow):
             """)
         else:
             self.editor.setStyleSheet("""
-                QTextEdit {
+                QPlainTextEdit {
                     background-color: #ffffff;
                     color: #333333;
                     border: 1px solid #ddd;
@@ -892,175 +1985,130 @@ class MarkdownEditor(QMainWindow):
 
     def on_text_changed(self):
 
+        self._text_version += 1
 
-        self.update_timer.start(300)
+        # While typing fast, wait longer so bursts render and analyze once.
+        now = time.monotonic()
+        rapid = now - self._last_keystroke_at < _RAPID_TYPING_INTERVAL
+        self._last_keystroke_at = now
 
-        self.analysis_timer.start(800)
+        self.update_timer.start(_RAPID_PREVIEW_DELAY_MS if rapid else _PREVIEW_DELAY_MS)
 
-    def update_preview(self):
+        self.analysis_timer.start(_RAPID_ANALYSIS_DELAY_MS if rapid else _ANALYSIS_DELAY_MS)
 
-        markdown_text = self.editor.toPlainText()
+    def _editor_text(self) -> str:
+        """Return the editor text, sharing one snapshot between preview, analysis and export."""
 
+        if self._text_snapshot_version != self._text_version:
+            self._text_snapshot = self.editor.toPlainText()
+            self._text_snapshot_version = self._text_version
+        return self._text_snapshot
 
-        html = markdown.markdown(markdown_text, extensions=['codehilite', 'tables', 'toc'])
+    def update_preview(self):
 
-        theme_key = "dark" if self._dark_mode else "light"
-        pygments_css = ""
-        if PYGMENTS_AVAILABLE:
-            if self._pygments_css_by_theme[theme_key] is None:
-                style_name = "monokai" if self._dark_mode else "default"
-                self._pygments_css_by_theme[theme_key] = HtmlFormatter(style=style_name).get_style_defs('.codehilite')
-            pygments_css = self._pygments_css_by_theme[theme_key]
+        markdown_text = self._editor_text()
 
-        if self._dark_mode:
-            body_bg = "#0d1117"
-            body_fg = "#c9d1d9"
-            border = "#30363d"
-            muted = "#8b949e"
-            link = "#2f81f7"
-            code_bg = "#161b22"
-        else:
-            body_bg = "#fff"
-            body_fg = "#333"
-            border = "#eaecef"
-            muted = "#6a737d"
-            link = "#0366d6"
-            code_bg = "#f6f8fa"
+        # Any render still running for older text is now stale.
+        self._preview_epoch += 1
 
+        cache_key = hash(markdown_text)
+        html = self._preview_html_cache.get(cache_key)
+        if html is not None:
+            self._show_preview_html(html)
+            return
+
+        if self._preview_rendering:
+            # Keep one render in flight; the latest text is picked up when it ends.
+            self._preview_render_pending = True
+            return
+        self._preview_rendering = True
+        task = _PreviewRenderTask(self._preview_epoch, cache_key, markdown_text,
+                                  self._preview_block_cache, self._preview_signals)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_preview_rendered(self, epoch: int, cache_key: int, html: str, blocks: dict) -> None:
+        self._preview_rendering = False
+        if html is not None:
+            self._preview_block_cache = blocks
+            self._cache_put(self._preview_html_cache, cache_key, html)
+        if epoch == self._preview_epoch:
+            if html is not None:
+                self._show_preview_html(html)
+        if self._preview_render_pending:
+            self._preview_render_pending = False
+            self.update_preview()
+
+    def _show_preview_html(self, html: str) -> None:
+        """Show a rendered body in the preview, reloading the page only when its shell changed."""
+
+        pygments_css = _pygments_css("monokai" if self._dark_mode else "default")
 
         custom_css = self._get_custom_preview_css()
-        styled_html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <style>
-                {pygments_css}
-                body {{
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                    line-height: 1.6;
-                    color: {body_fg};
-                    max-width: 800px;
-                    margin: 0 auto;
-                    padding: 20px;
-                    background-color: {body_bg};
-                }}
-                h1, h2, h3, h4, h5, h6 {{
-                    margin-top: 24px;
-                    margin-bottom: 16px;
-                    font-weight: 600;
-                    line-height: 1.25;
-                }}
-                h1 {{ font-size: 2em; border-bottom: 1px solid {border}; padding-bottom: 0.3em; }}
-                h2 {{ font-size: 1.5em; border-bottom: 1px solid {border}; padding-bottom: 0.3em; }}
-                h3 {{ font-size: 1.25em; }}
-                h4 {{ font-size: 1em; }}
-                h5 {{ font-size: 0.875em; }}
-                h6 {{ font-size: 0.85em; color: {muted}; }}
-                p {{ margin-bottom: 16px; }}
-                code {{
-                    background-color: {code_bg};
-                    border-radius: 3px;
-                    font-size: 85%;
-                    margin: 0;
-                    padding: 0.2em 0.4em;
-                }}
-                pre {{
-                    background-color: {code_bg};
-                    border-radius: 6px;
-                    padding: 16px;
-                    overflow: auto;
-                    font-size: 85%;
-                    line-height: 1.45;
-                }}
-                .codehilite {{
-                    background-color: {code_bg};
-                    border-radius: 6px;
-                    padding: 16px;
-                    overflow: auto;
-                    margin-bottom: 16px;
-                }}
-                .codehilite pre {{
-                    margin: 0;
-                    padding: 0;
-                    background: transparent;
-                }}
-                pre code {{
-                    background-color: transparent;
-                    border: 0;
-                    display: inline;
-                    line-height: inherit;
-                    margin: 0;
-                    max-width: auto;
-                    overflow: visible;
-                    padding: 0;
-                    word-wrap: normal;
-                }}
-                blockquote {{
-                    border-left: 0.25em solid {border};
-                    color: {muted};
-                    padding: 0 1em;
-                    margin: 0 0 16px 0;
-                }}
-                table {{
-                    border-spacing: 0;
-                    border-collapse: collapse;
-                    margin-bottom: 16px;
-                }}
-                table th, table td {{
-                    border: 1px solid {border};
-                    padding: 6px 13px;
-                }}
-                table th {{
-                    background-color: {code_bg};
-                    font-weight: 600;
-                }}
-                table tr:nth-child(2n) {{
-                    background-color: {code_bg};
-                }}
-                ul, ol {{
-                    padding-left: 2em;
-                    margin-bottom: 16px;
-                }}
-                li {{
-                    margin-bottom: 0.25em;
-                }}
-                a {{
-                    color: {link};
-                    text-decoration: none;
-                }}
-                a:hover {{
-                    text-decoration: underline;
-                }}
-                img {{
-                    max-width: 100%;
-                    height: auto;
-                }}
-                hr {{
-                    border: none;
-                    border-top: 1px solid {border};
-                    height: 1px;
-                    margin: 24px 0;
-                }}
-                {custom_css}
-            </style>
-        </head>
-        <body>
-            {html}
-        </body>
-        </html>
-        """
+        shell = _build_preview_shell(self._dark_mode, pygments_css, custom_css)
+
+        self._preview_body = html
+        if shell != self._preview_shell:
+            # Theme or stylesheet changed: reload the whole page once.
+            head, tail = shell
+            self._preview_shell = shell
+            self._preview_loading_body = html
+            self._preview_dom_body = None
+            self.preview.setHtml(head + html + tail)
+        elif self._preview_dom_body is not None:
+            self._push_preview_body()
+
+    def _push_preview_body(self) -> None:
+        """Swap the rendered body into the loaded preview page without reloading it."""
+
+        if self._preview_body == self._preview_dom_body:
+            return
+        script = (
+            "(function () {"
+            f" var content = document.querySelector({json.dumps(_PREVIEW_CONTENT_SELECTOR)});"
+            " if (!content) { return false; }"
+            f" content.innerHTML = {json.dumps(self._preview_body)};"
+            " return true;"
+            " })();"
+        )
+        self._preview_dom_body = self._preview_body
+        self.preview.page().runJavaScript(script, 0, self._on_preview_patched)
 
+    def _on_preview_load_finished(self, ok: bool) -> None:
+        if not ok:
+            self._preview_shell = None
+            return
+        # Link clicks also finish loads; only our own shell carries the marker.
+        script = f"document.querySelector({json.dumps(_PREVIEW_CONTENT_SELECTOR)}) !== null;"
+        self.preview.page().runJavaScript(script, 0, self._on_preview_load_checked)
+
+    def _on_preview_load_checked(self, is_preview) -> None:
+        if not is_preview:
+            # Leave the followed page up; the next edit reloads the shell.
+            self._preview_shell = None
+            self._preview_dom_body = None
+            return
+        self._preview_dom_body = self._preview_loading_body
+        self._push_preview_body()
 
-        self.preview.setHtml(styled_html)
+    def _on_preview_patched(self, patched) -> None:
+        if patched:
+            return
+        # The view navigated away from the preview page (e.g. a followed link).
+        self._preview_shell = None
+        self._preview_dom_body = None
+        self.update_preview()
 
     def update_analysis(self):
         """Update the Smart Assistant panel with document analysis."""
 
-        markdown_text = self.editor.toPlainText()
+        markdown_text = self._editor_text()
+
+        # Any result still being computed for older text is now stale.
+        self._analysis_epoch += 1
 
         if not markdown_text.strip():
 
+            self._shown_metrics = None
             self.stats_labels['words'].setText("Words: 0")
             self.stats_labels['chars'].setText("Characters: 0")
             self.stats_labels['lines'].setText("Lines: 0")
@@ -1080,9 +2128,29 @@ class MarkdownEditor(QMainWindow):
             return
 
 
-        analyzer = MarkdownAnalyzer(markdown_text)
-        metrics = analyzer.analyze()
+        cache_key = hash(markdown_text)
+        metrics = self._analysis_cache.get(cache_key)
+        if metrics is not None:
+            self._show_metrics(metrics)
+            return
+
+        task = _AnalysisTask(self._analysis_epoch, cache_key, markdown_text, self._analysis_signals)
+        QThreadPool.globalInstance().start(task)
 
+    def _on_analysis_finished(self, epoch: int, cache_key: int, metrics: dict) -> None:
+        if metrics is None:
+            return
+        self._cache_put(self._analysis_cache, cache_key, metrics)
+        if epoch == self._analysis_epoch:
+            self._show_metrics(metrics)
+
+    def _show_metrics(self, metrics: dict) -> None:
+        """Fill the Smart Assistant labels from an analysis metrics dictionary."""
+
+        # Cached results are shared dicts, so re-showing the same text is a no-op.
+        if metrics is self._shown_metrics:
+            return
+        self._shown_metrics = metrics
 
         self.stats_labels['words'].setText(f"Words: {metrics['word_count']}")
         self.stats_labels['chars'].setText(f"Characters: {metrics['char_count']}")
@@ -1091,8 +2159,10 @@ class MarkdownEditor(QMainWindow):
 
 
         total_headings = sum(metrics['headings'].values())
-        heading_breakdown = ', '.join([f"H{i}: {metrics['headings'][f'h{i}']}"
-                                      for i in range(1, 7) if metrics['headings'][f'h{i}'] > 0])
+        heading_breakdown = ""
+        if total_headings:
+            heading_breakdown = ', '.join([f"H{i}: {metrics['headings'][f'h{i}']}"
+                                          for i in range(1, 7) if metrics['headings'][f'h{i}'] > 0])
         self.structure_labels['headings'].setText(f"Headings: {total_headings} ({heading_breakdown})" if heading_breakdown else f"Headings: {total_headings}")
         self.structure_labels['links'].setText(f"Links: {metrics['links']}")
         self.structure_labels['images'].setText(f"Images: {metrics['images']}")
@@ -1105,17 +2175,33 @@ class MarkdownEditor(QMainWindow):
         readability = metrics['readability_score']
         readability_color = "green" if readability >= 80 else "orange" if readability >= 60 else "red"
         self.quality_labels['readability'].setText(f"Readability: {readability}/100")
-        self.quality_labels['readability'].setStyleSheet(f"color: {readability_color}; font-weight: bold;")
+        self._set_label_style(self.quality_labels['readability'], f"color: {readability_color}; font-weight: bold;")
 
         structure_quality = metrics['structure_quality']
         structure_color = "green" if structure_quality == "Excellent" else "orange" if structure_quality == "Good" else "red"
         self.quality_labels['structure_quality'].setText(f"Structure: {structure_quality}")
-        self.quality_labels['structure_quality'].setStyleSheet(f"color: {structure_color}; font-weight: bold;")
+        self._set_label_style(self.quality_labels['structure_quality'], f"color: {structure_color}; font-weight: bold;")
 
 
-        issues_text = "\n".join(f"• {issue}" for issue in metrics['broken_links'])
+        issues = metrics['broken_links']
+        issues_text = "• " + "\n• ".join(issues) if issues else ""
         self.issues_label.setText(issues_text)
 
+    @staticmethod
+    def _set_label_style(label: QLabel, style: str) -> None:
+        """Apply a style sheet only when it differs, since each call re-polishes the label."""
+
+        if label.styleSheet() != style:
+            label.setStyleSheet(style)
+
+    @staticmethod
+    def _cache_put(cache: dict, key, value) -> None:
+        """Store a value in a small FIFO cache bounded by _RENDER_CACHE_SIZE."""
+
+        cache[key] = value
+        while len(cache) > _RENDER_CACHE_SIZE:
+            del cache[next(iter(cache))]
+
     def auto_format_document(self):
         """Auto-format the markdown document with best practices."""
 
@@ -1143,14 +2229,15 @@ class MarkdownEditor(QMainWindow):
 
         for i, line in enumerate(lines):
             stripped = line.strip()
+            head = stripped[:1]
 
+            # The branches are exclusive on the first non-blank character,
+            # so only the matching one needs to look at the line.
+            if head == '#':
+                if i > 0 and not prev_was_empty:
+                    formatted_lines.append('')
 
-            if stripped.startswith('#') and i > 0 and not prev_was_empty:
-                formatted_lines.append('')
-
-
-            if stripped.startswith('#'):
-                match = re.match(r'^(#{1,6})(\S)', stripped)
+                match = _RE_FMT_HEADING.match(stripped)
                 if match:
                     level = match.group(1)
                     rest = stripped[len(level):]
@@ -1159,27 +2246,24 @@ class MarkdownEditor(QMainWindow):
                     prev_was_empty = False
                     continue
 
+            elif head and head in '-*+':
+                content = line.lstrip()
+                if content[1:2] and not content[1].isspace():
+                    indent = line[:len(line) - len(content)]
+                    formatted_lines.append(f"{indent}{head} {content[1:].strip()}")
+                    prev_was_heading = False
+                    prev_was_empty = False
+                    continue
 
-            if re.match(r'^(\s*)([-*+])(\S)', line):
-                match = re.match(r'^(\s*)([-*+])(.*)$', line)
-                indent = match.group(1)
-                marker = match.group(2)
-                content = match.group(3).strip()
-                formatted_lines.append(f"{indent}{marker} {content}")
-                prev_was_heading = False
-                prev_was_empty = False
-                continue
-
-
-            if re.match(r'^(\s*)(\d+\.)(\S)', line):
-                match = re.match(r'^(\s*)(\d+\.)(.*)$', line)
-                indent = match.group(1)
-                marker = match.group(2)
-                content = match.group(3).strip()
-                formatted_lines.append(f"{indent}{marker} {content}")
-                prev_was_heading = False
-                prev_was_empty = False
-                continue
+            elif head.isdecimal():
+                content = line.lstrip()
+                number, dot, rest = content.partition('.')
+                if dot and number.isdecimal() and rest[:1] and not rest[0].isspace():
+                    indent = line[:len(line) - len(content)]
+                    formatted_lines.append(f"{indent}{number}. {rest.strip()}")
+                    prev_was_heading = False
+                    prev_was_empty = False
+                    continue
 
 
             if not stripped:
@@ -1202,6 +2286,7 @@ class MarkdownEditor(QMainWindow):
     def new_file(self):
         self.editor.clear()
         self.current_file = None
+        self._last_saved_digest = None
         self.editor.document().setModified(False)
 
     def open_file(self):
@@ -1221,6 +2306,7 @@ class MarkdownEditor(QMainWindow):
             self.editor.setPlainText(content)
             self.editor.document().setModified(False)
             self.current_file = file_path
+            self._last_saved_digest = _text_digest(self._editor_text())
             self._add_recent_file(file_path)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Could not open file: {str(e)}")
@@ -1244,9 +2330,10 @@ class MarkdownEditor(QMainWindow):
 
     def _save_to_file(self, file_path: str, *, show_errors: bool, update_recent: bool) -> bool:
         try:
-            with open(file_path, 'w', encoding='utf-8') as file:
-                file.write(self.editor.toPlainText())
+            text = self._editor_text()
+            _write_text_file(file_path, text)
             self.current_file = file_path
+            self._last_saved_digest = _text_digest(text)
             self.editor.document().setModified(False)
             if update_recent:
                 self._add_recent_file(file_path)
@@ -1261,6 +2348,10 @@ class MarkdownEditor(QMainWindow):
             return
         if not self.editor.document().isModified():
             return
+        if _text_digest(self._editor_text()) == self._last_saved_digest:
+            # Edits were undone back to the saved text; nothing to write.
+            self.editor.document().setModified(False)
+            return
 
         self._save_to_file(self.current_file, show_errors=False, update_recent=False)
 
@@ -1273,27 +2364,30 @@ class MarkdownEditor(QMainWindow):
         self._custom_preview_css_path = file_path
         self._custom_preview_css_cache = ""
         self._custom_preview_css_cache_mtime = None
-        self._settings.setValue("previewCssPath", self._custom_preview_css_path)
+        self._custom_preview_css_recheck_at = 0.0
+        self._queue_setting("previewCssPath", self._custom_preview_css_path)
         self.update_preview()
 
     def clear_preview_css(self) -> None:
         self._custom_preview_css_path = ""
         self._custom_preview_css_cache = ""
         self._custom_preview_css_cache_mtime = None
-        self._settings.setValue("previewCssPath", "")
+        self._custom_preview_css_recheck_at = 0.0
+        self._queue_setting("previewCssPath", "")
         self.update_preview()
 
     def _get_custom_preview_css(self) -> str:
         path = (self._custom_preview_css_path or "").strip()
         if not path:
             return ""
-        if not os.path.exists(path):
-
+        now = time.monotonic()
+        if now < self._custom_preview_css_recheck_at:
+            return self._custom_preview_css_cache
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
             self.clear_preview_css()
             return ""
-
-        try:
-            mtime = os.path.getmtime(path)
         except OSError:
             return ""
 
@@ -1305,8 +2399,28 @@ class MarkdownEditor(QMainWindow):
             except Exception:
                 return ""
 
+        self._custom_preview_css_recheck_at = now + _CSS_STAT_INTERVAL
         return self._custom_preview_css_cache
 
+    def _queue_setting(self, key: str, value) -> None:
+        """Record a settings change; pending changes are written together shortly after."""
+
+        self._pending_settings[key] = value
+        self._settings_flush_timer.start()
+
+    def _flush_settings(self) -> None:
+        self._settings_flush_timer.stop()
+        if not self._pending_settings:
+            return
+        for key, value in self._pending_settings.items():
+            self._settings.setValue(key, value)
+        self._pending_settings = {}
+        self._settings.sync()
+
+    def closeEvent(self, event):
+        self._flush_settings()
+        super().closeEvent(event)
+
     def _load_recent_files(self) -> list:
         value = self._settings.value("recentFiles", [])
         if value is None:
@@ -1318,7 +2432,7 @@ class MarkdownEditor(QMainWindow):
         return []
 
     def _save_recent_files(self) -> None:
-        self._settings.setValue("recentFiles", self._recent_files)
+        self._queue_setting("recentFiles", list(self._recent_files))
 
     def _add_recent_file(self, file_path: str) -> None:
         if not file_path:
@@ -1328,7 +2442,6 @@ class MarkdownEditor(QMainWindow):
         self._recent_files.insert(0, file_path)
         self._recent_files = self._recent_files[:10]
         self._save_recent_files()
-        self._rebuild_recent_files_menu()
 
     def _clear_recent_files(self) -> None:
         self._recent_files = []
@@ -1342,8 +2455,9 @@ class MarkdownEditor(QMainWindow):
         self.recent_files_menu.clear()
 
         existing = [p for p in self._recent_files if p and os.path.exists(p)]
-        self._recent_files = existing
-        self._save_recent_files()
+        if existing != self._recent_files:
+            self._recent_files = existing
+            self._save_recent_files()
 
         if not self._recent_files:
             empty_action = self.recent_files_menu.addAction("(No recent files)")
@@ -1388,647 +2502,113 @@ class MarkdownEditor(QMainWindow):
             self, f"Export as {file_format.upper()}", "", file_filters[file_format]
         )
 
-        if file_path:
-            try:
-                if file_format == 'md':
-                    self.export_as_markdown(file_path)
-                elif file_format == 'txt':
-                    self.export_as_text(file_path)
-                elif file_format == 'html':
-                    self.export_as_html(file_path)
-                elif file_format == 'docx':
-                    self.export_as_docx(file_path)
-                elif file_format == 'pdf':
-                    self.export_as_pdf(file_path)
-                elif file_format == 'rtf':
-                    self.export_as_rtf(file_path)
-                elif file_format == 'odt':
-                    self.export_as_odt(file_path)
-
-                QMessageBox.information(self, "Export Successful", f"File exported successfully to {file_path}")
-            except Exception as e:
-                QMessageBox.critical(self, "Export Error", f"Could not export file: {str(e)}")
+        if not file_path:
+            return
 
-    def export_as_markdown(self, file_path):
+        exporter = _BACKGROUND_EXPORTERS.get(file_format)
+        if exporter is not None:
+            # The text is snapshotted here; the window stays usable while it renders.
+            task = _ExportTask(exporter, self._editor_text(), file_path, self._export_signals)
+            QThreadPool.globalInstance().start(task)
+            return
 
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write(self.editor.toPlainText())
+        try:
+            if file_format == 'md':
+                self.export_as_markdown(file_path)
+            elif file_format == 'txt':
+                self.export_as_text(file_path)
 
-    def export_as_text(self, file_path):
+            QMessageBox.information(self, "Export Successful", f"File exported successfully to {file_path}")
+        except Exception as e:
+            QMessageBox.critical(self, "Export Error", f"Could not export file: {str(e)}")
 
-        markdown_text = self.editor.toPlainText()
+    def export_all_formats(self):
+        """Ask for a base file name and export every available rich format next to it."""
 
-        import re
-        text = markdown_text
+        file_path, _ = QFileDialog.getSaveFileName(self, "Export All Formats", "", "All Files (*)")
+        if not file_path:
+            return
+        # Drop only an export extension, so "notes.v2" stays "notes.v2".
+        base_path, ext = os.path.splitext(file_path)
+        if ext[1:].lower() not in _BACKGROUND_EXPORTERS and ext.lower() not in ('.md', '.txt'):
+            base_path = file_path
+        self.export_all(base_path)
+
+    def export_all(self, base_path: str) -> None:
+        """Export to base_path.<ext> for each background format, all running concurrently."""
+
+        formats = [
+            file_format for file_format in _BACKGROUND_EXPORTERS
+            if (file_format != 'docx' or DOCX_AVAILABLE)
+            and (file_format != 'pdf' or PDF_AVAILABLE or WEASYPRINT_AVAILABLE)
+        ]
+        targets = [f"{base_path}.{file_format}" for file_format in formats]
+        existing = [os.path.basename(path) for path in targets if os.path.exists(path)]
+        if existing:
+            answer = QMessageBox.question(
+                self, "Export All Formats",
+                "These files already exist:\n" + "\n".join(existing) + "\n\nOverwrite them?"
+            )
+            if answer != QMessageBox.StandardButton.Yes:
+                return
+        markdown_text = self._editor_text()
+
+        # One signals object per batch, so a single summary is shown at the end.
+        signals = _ExportSignals(self)
+        pending = set(targets)
+        errors = []
+
+        def on_finished(file_path, error):
+            pending.discard(file_path)
+            if error:
+                errors.append(f"{os.path.basename(file_path)}: {error}")
+            if pending:
+                return
+            signals.deleteLater()
+            if errors:
+                QMessageBox.critical(self, "Export Error", "Could not export:\n" + "\n".join(errors))
+            else:
+                QMessageBox.information(self, "Export Successful",
+                                        f"Exported {', '.join(formats)} to {base_path}.*")
 
-        text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
+        signals.finished.connect(on_finished)
+        pool = QThreadPool.globalInstance()
+        for file_format, file_path in zip(formats, targets):
+            pool.start(_ExportTask(_BACKGROUND_EXPORTERS[file_format], markdown_text, file_path, signals))
 
-        text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)
-        text = re.sub(r'\*(.*?)\*', r'\1', text)
+    def _on_export_finished(self, file_path: str, error: str) -> None:
+        if error:
+            QMessageBox.critical(self, "Export Error", f"Could not export file: {error}")
+        else:
+            QMessageBox.information(self, "Export Successful", f"File exported successfully to {file_path}")
 
-        text = re.sub(r'```.*?\n(.*?)\n```', r'\1', text, flags=re.DOTALL)
-        text = re.sub(r'`(.*?)`', r'\1', text)
+    def export_as_markdown(self, file_path):
 
-        text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
+        _write_text_file(file_path, self._editor_text())
 
-        text = re.sub(r'!\[([^\]]*)\]\([^\)]+\)', r'[\1]', text)
+    def export_as_text(self, file_path):
 
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write(text)
+        _export_text(self._editor_text(), file_path)
 
     def export_as_html(self, file_path):
 
-        markdown_text = self.editor.toPlainText()
-        html = markdown.markdown(markdown_text, extensions=['codehilite', 'tables', 'toc'])
-
-        pygments_css = ""
-        if PYGMENTS_AVAILABLE:
-            pygments_css = HtmlFormatter(style="default").get_style_defs('.codehilite')
-
-        styled_html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>Exported Markdown Document</title>
-    <style>
-        {pygments_css}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #fff;
-        }}
-        h1, h2, h3, h4, h5, h6 {{
-            margin-top: 24px;
-            margin-bottom: 16px;
-            font-weight: 600;
-            line-height: 1.25;
-        }}
-        h1 {{ font-size: 2em; border-bottom: 1px solid #eaecef; padding-bottom: 0.3em; }}
-        h2 {{ font-size: 1.5em; border-bottom: 1px solid #eaecef; padding-bottom: 0.3em; }}
-        h3 {{ font-size: 1.25em; }}
-        h4 {{ font-size: 1em; }}
-        h5 {{ font-size: 0.875em; }}
-        h6 {{ font-size: 0.85em; color: #6a737d; }}
-        p {{ margin-bottom: 16px; }}
-        code {{
-            background-color: #f6f8fa;
-            border-radius: 3px;
-            font-size: 85%;
-            margin: 0;
-            padding: 0.2em 0.4em;
-        }}
-        pre {{
-            background-color: #f6f8fa;
-            border-radius: 6px;
-            padding: 16px;
-            overflow: auto;
-            font-size: 85%;
-            line-height: 1.45;
-        }}
-        pre code {{
-            background-color: transparent;
-            border: 0;
-            display: inline;
-            line-height: inherit;
-            margin: 0;
-            max-width: auto;
-            overflow: visible;
-            padding: 0;
-            word-wrap: normal;
-        }}
-        blockquote {{
-            border-left: 0.25em solid #dfe2e5;
-            color: #6a737d;
-            padding: 0 1em;
-            margin: 0 0 16px 0;
-        }}
-        table {{
-            border-spacing: 0;
-            border-collapse: collapse;
-            margin-bottom: 16px;
-        }}
-        table th, table td {{
-            border: 1px solid #dfe2e5;
-            padding: 6px 13px;
-        }}
-        table th {{
-            background-color: #f6f8fa;
-            font-weight: 600;
-        }}
-        table tr:nth-child(2n) {{
-            background-color: #f6f8fa;
-        }}
-        ul, ol {{
-            padding-left: 2em;
-            margin-bottom: 16px;
-        }}
-        li {{
-            margin-bottom: 0.25em;
-        }}
-        a {{
-            color: #0366d6;
-            text-decoration: none;
-        }}
-        a:hover {{
-            text-decoration: underline;
-        }}
-        img {{
-            max-width: 100%;
-            height: auto;
-        }}
-        hr {{
-            border: none;
-            border-top: 1px solid #eaecef;
-            height: 1px;
-            margin: 24px 0;
-        }}
-    </style>
-</head>
-<body>
-    {html}
-</body>
-</html>"""
-
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write(styled_html)
+        _export_html(self._editor_text(), file_path)
 
     def export_as_docx(self, file_path):
 
-        if not DOCX_AVAILABLE:
-            raise ImportError("python-docx library is not available")
-
-        markdown_text = self.editor.toPlainText()
-        html = markdown.markdown(markdown_text, extensions=['codehilite', 'tables', 'toc'])
-
-
-        doc = Document()
-
-
-        doc.add_heading('Exported Markdown Document', 0)
-
-
-        lines = markdown_text.split('\n')
-        in_code_block = False
-        code_content = []
-
-        for line in lines:
-            if line.strip().startswith('```'):
-                if in_code_block:
-
-                    if code_content:
-                        paragraph = doc.add_paragraph()
-                        run = paragraph.add_run('\n'.join(code_content))
-                        run.font.name = 'Courier New'
-                        code_content = []
-                    in_code_block = False
-                else:
-
-                    in_code_block = True
-                continue
-
-            if in_code_block:
-                code_content.append(line)
-                continue
-
-
-            if line.startswith('# '):
-                doc.add_heading(line[2:], level=1)
-            elif line.startswith('## '):
-                doc.add_heading(line[3:], level=2)
-            elif line.startswith('### '):
-                doc.add_heading(line[4:], level=3)
-            elif line.startswith('#### '):
-                doc.add_heading(line[5:], level=4)
-            elif line.startswith('##### '):
-                doc.add_heading(line[6:], level=5)
-            elif line.startswith('###### '):
-                doc.add_heading(line[7:], level=6)
-
-            elif line.strip() == '---' or line.strip() == '***':
-                doc.add_paragraph('_' * 50)
-
-            elif line.strip().startswith(('- ', '* ', '+ ')):
-                p = doc.add_paragraph(line.strip()[2:], style='List Bullet')
-            elif line.strip() and line.strip()[0].isdigit() and line.strip().find('.') == 1:
-                p = doc.add_paragraph(line.strip()[3:], style='List Number')
-
-            elif not line.strip():
-                doc.add_paragraph()
-
-            elif line.strip():
-
-                processed_line = line
-
-                processed_line = re.sub(r'\*\*(.*?)\*\*', r'\1', processed_line)
-
-                processed_line = re.sub(r'\*(.*?)\*', r'\1', processed_line)
-
-                processed_line = re.sub(r'`(.*?)`', r'\1', processed_line)
-
-                processed_line = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', processed_line)
-
-                doc.add_paragraph(processed_line)
-
-        doc.save(file_path)
+        _export_docx(self._editor_text(), file_path)
 
     def export_as_pdf(self, file_path):
 
-        markdown_text = self.editor.toPlainText()
-
-
-        if WEASYPRINT_AVAILABLE:
-            html = markdown.markdown(markdown_text, extensions=['codehilite', 'tables', 'toc'])
-
-            styled_html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>Exported Markdown Document</title>
-    <style>
-        @page {{
-            size: letter;
-            margin: 1in;
-        }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            font-size: 12pt;
-        }}
-        h1, h2, h3, h4, h5, h6 {{
-            margin-top: 24px;
-            margin-bottom: 16px;
-            font-weight: 600;
-            line-height: 1.25;
-        }}
-        h1 {{ font-size: 2em; border-bottom: 1px solid #eaecef; padding-bottom: 0.3em; }}
-        h2 {{ font-size: 1.5em; border-bottom: 1px solid #eaecef; padding-bottom: 0.3em; }}
-        h3 {{ font-size: 1.25em; }}
-        h4 {{ font-size: 1em; }}
-        h5 {{ font-size: 0.875em; }}
-        h6 {{ font-size: 0.85em; color: #6a737d; }}
-        p {{ margin-bottom: 16px; }}
-        code {{
-            background-color: #f6f8fa;
-            border-radius: 3px;
-            font-size: 85%;
-            margin: 0;
-            padding: 0.2em 0.4em;
-        }}
-        pre {{
-            background-color: #f6f8fa;
-            border-radius: 6px;
-            padding: 16px;
-            overflow: auto;
-            font-size: 85%;
-            line-height: 1.45;
-        }}
-        pre code {{
-            background-color: transparent;
-            border: 0;
-            display: inline;
-            line-height: inherit;
-            margin: 0;
-            max-width: auto;
-            overflow: visible;
-            padding: 0;
-            word-wrap: normal;
-        }}
-        blockquote {{
-            border-left: 0.25em solid #dfe2e5;
-            color: #6a737d;
-            padding: 0 1em;
-            margin: 0 0 16px 0;
-        }}
-        table {{
-            border-spacing: 0;
-            border-collapse: collapse;
-            margin-bottom: 16px;
-        }}
-        table th, table td {{
-            border: 1px solid #dfe2e5;
-            padding: 6px 13px;
-        }}
-        table th {{
-            background-color: #f6f8fa;
-            font-weight: 600;
-        }}
-        table tr:nth-child(2n) {{
-            background-color: #f6f8fa;
-        }}
-        ul, ol {{
-            padding-left: 2em;
-            margin-bottom: 16px;
-        }}
-        li {{
-            margin-bottom: 0.25em;
-        }}
-        a {{
-            color: #0366d6;
-            text-decoration: none;
-        }}
-        img {{
-            max-width: 100%;
-            height: auto;
-        }}
-        hr {{
-            border: none;
-            border-top: 1px solid #eaecef;
-            height: 1px;
-            margin: 24px 0;
-        }}
-    </style>
-</head>
-<body>
-    {html}
-</body>
-</html>"""
-
-
-            weasyprint.HTML(string=styled_html).write_pdf(file_path)
-
-
-        elif PDF_AVAILABLE:
-            doc = SimpleDocTemplate(file_path, pagesize=letter)
-            styles = getSampleStyleSheet()
-            story = []
-
-
-            title_style = styles['Title']
-            title = Paragraph("Exported Markdown Document", title_style)
-            story.append(title)
-            story.append(Spacer(1, 12))
-
-
-            lines = markdown_text.split('\n')
-            in_code_block = False
-            code_content = []
-
-            for line in lines:
-                if line.strip().startswith('```'):
-                    if in_code_block:
-
-                        if code_content:
-                            code_text = '\n'.join(code_content)
-                            code_style = styles['Code']
-                            code_para = Paragraph(code_text, code_style)
-                            story.append(code_para)
-                            story.append(Spacer(1, 6))
-                            code_content = []
-                        in_code_block = False
-                    else:
-
-                        in_code_block = True
-                    continue
-
-                if in_code_block:
-                    code_content.append(line)
-                    continue
-
-
-                if line.startswith('# '):
-                    story.append(Paragraph(line[2:], styles['Heading1']))
-                elif line.startswith('## '):
-                    story.append(Paragraph(line[3:], styles['Heading2']))
-                elif line.startswith('### '):
-                    story.append(Paragraph(line[4:], styles['Heading3']))
-                elif line.startswith('#### '):
-                    story.append(Paragraph(line[5:], styles['Heading4']))
-                elif line.startswith('##### '):
-                    story.append(Paragraph(line[6:], styles['Heading5']))
-                elif line.startswith('###### '):
-                    story.append(Paragraph(line[7:], styles['Heading6']))
-
-                elif line.strip() == '---' or line.strip() == '***':
-                    story.append(Spacer(1, 12))
-
-                elif line.strip().startswith(('- ', '* ', '+ ')):
-                    story.append(Paragraph(f"• {line.strip()[2:]}", styles['Normal']))
-                elif line.strip() and line.strip()[0].isdigit() and line.strip().find('.') == 1:
-                    story.append(Paragraph(f"{line.strip()}", styles['Normal']))
-
-                elif not line.strip():
-                    story.append(Spacer(1, 6))
-
-                elif line.strip():
-
-                    processed_line = line
-
-                    processed_line = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', processed_line)
-
-                    processed_line = re.sub(r'\*(.*?)\*', r'<i>\1</i>', processed_line)
-
-                    processed_line = re.sub(r'`(.*?)`', r'<font name="Courier">\1</font>', processed_line)
-
-                    processed_line = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', processed_line)
-
-                    story.append(Paragraph(processed_line, styles['Normal']))
-
-            doc.build(story)
-
-        else:
-            raise ImportError("Neither weasyprint nor reportlab is available")
+        _export_pdf(self._editor_text(), file_path)
 
     def export_as_rtf(self, file_path):
 
-        markdown_text = self.editor.toPlainText()
-        html = markdown.markdown(markdown_text, extensions=['codehilite', 'tables', 'toc'])
-
-
-        rtf_content = r"{\rtf1\ansi\deff0"
-        rtf_content += r"{\fonttbl{\f0 Times New Roman;}}"
-        rtf_content += r"{\colortbl;\red0\green0\blue0;}"
-        rtf_content += r"\fs24"
-
-
-        lines = markdown_text.split('\n')
-        in_code_block = False
-        code_content = []
-
-        for line in lines:
-            if line.strip().startswith('```'):
-                if in_code_block:
-
-                    if code_content:
-                        rtf_content += r"{\pard\plain\f0\fs20 "
-                        for code_line in code_content:
-                            rtf_content += code_line.replace('\\', '\\\\').replace('{', '\\{').replace('}', '\\}') + r"\line "
-                        rtf_content += r"}\par"
-                        code_content = []
-                    in_code_block = False
-                else:
-
-                    in_code_block = True
-                continue
-
-            if in_code_block:
-                code_content.append(line)
-                continue
-
-
-            if line.startswith('# '):
-                rtf_content += r"{\pard\plain\f0\fs36\b " + line[2:].replace('\\', '\\\\').replace('{', '\\{').replace('}', '\\}') + r"}\par"
-            elif line.startswith('## '):
-                rtf_content += r"{\pard\plain\f0\fs32\b " + line[3:].replace('\\', '\\\\').replace('{', '\\{').replace('}', '\\}') + r"}\par"
-            elif line.startswith('### '):
-                rtf_content += r"{\pard\plain\f0\fs28\b " + line[4:].replace('\\', '\\\\').replace('{', '\\{').replace('}', '\\}') + r"}\par"
-            elif line.startswith('#### '):
-                rtf_content += r"{\pard\plain\f0\fs26\b " + line[5:].replace('\\', '\\\\').replace('{', '\\{').replace('}', '\\}') + r"}\par"
-            elif line.startswith('##### '):
-                rtf_content += r"{\pard\plain\f0\fs24\b " + line[6:].replace('\\', '\\\\').replace('{', '\\{').replace('}', '\\}') + r"}\par"
-            elif line.startswith('###### '):
-                rtf_content += r"{\pard\plain\f0\fs22\b " + line[7:].replace('\\', '\\\\').replace('{', '\\{').replace('}', '\\}') + r"}\par"
-
-            elif line.strip() == '---' or line.strip() == '***':
-                rtf_content += r"{\pard\plain\f0\fs24 " + "_" * 50 + r"}\par"
-
-            elif line.strip().startswith(('- ', '* ', '+ ')):
-                rtf_content += r"{\pard\plain\f0\fs24 \bullet " + line.strip()[2:].replace('\\', '\\\\').replace('{', '\\{').replace('}', '\\}') + r"}\par"
-            elif line.strip() and line.strip()[0].isdigit() and line.strip().find('.') == 1:
-                rtf_content += r"{\pard\plain\f0\fs24 " + line.strip().replace('\\', '\\\\').replace('{', '\\{').replace('}', '\\}') + r"}\par"
-
-            elif not line.strip():
-                rtf_content += r"\par"
-
-            elif line.strip():
-
-                processed_line = line
-
-                processed_line = re.sub(r'\*\*(.*?)\*\*', r'\b \1\b0', processed_line)
-
-                processed_line = re.sub(r'\*(.*?)\*', r'\i \1\i0', processed_line)
-
-                processed_line = re.sub(r'`(.*?)`', r'\f1\fs18 \1\f0\fs24', processed_line)
-
-                processed_line = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', processed_line)
-
-                rtf_content += r"{\pard\plain\f0\fs24 " + processed_line.replace('\\', '\\\\').replace('{', '\\{').replace('}', '\\}') + r"}\par"
-
-        rtf_content += "}"
-
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write(rtf_content)
+        _export_rtf(self._editor_text(), file_path)
 
     def export_as_odt(self, file_path):
 
-
-        import zipfile
-        import xml.etree.ElementTree as ET
-
-        markdown_text = self.editor.toPlainText()
-        html = markdown.markdown(markdown_text, extensions=['codehilite', 'tables', 'toc'])
-
-
-        content = ET.Element("office:document-content")
-        content.set("xmlns:office", "urn:oasis:names:tc:opendocument:xmlns:office:1.0")
-        content.set("xmlns:text", "urn:oasis:names:tc:opendocument:xmlns:text:1.0")
-        content.set("xmlns:style", "urn:oasis:names:tc:opendocument:xmlns:style:1.0")
-        content.set("office:version", "1.0")
-
-        body = ET.SubElement(content, "office:body")
-        text = ET.SubElement(body, "office:text")
-
-
-        lines = markdown_text.split('\n')
-        in_code_block = False
-        code_content = []
-
-        for line in lines:
-            if line.strip().startswith('```'):
-                if in_code_block:
-
-                    if code_content:
-                        for code_line in code_content:
-                            p = ET.SubElement(text, "text:p")
-                            p.text = code_line
-                        code_content = []
-                    in_code_block = False
-                else:
-
-                    in_code_block = True
-                continue
-
-            if in_code_block:
-                code_content.append(line)
-                continue
-
-
-            if line.startswith('# '):
-                h = ET.SubElement(text, "text:h", attrib={"text:outline-level": "1"})
-                h.text = line[2:]
-            elif line.startswith('## '):
-                h = ET.SubElement(text, "text:h", attrib={"text:outline-level": "2"})
-                h.text = line[3:]
-            elif line.startswith('### '):
-                h = ET.SubElement(text, "text:h", attrib={"text:outline-level": "3"})
-                h.text = line[4:]
-            elif line.startswith('#### '):
-                h = ET.SubElement(text, "text:h", attrib={"text:outline-level": "4"})
-                h.text = line[5:]
-            elif line.startswith('##### '):
-                h = ET.SubElement(text, "text:h", attrib={"text:outline-level": "5"})
-                h.text = line[6:]
-            elif line.startswith('###### '):
-                h = ET.SubElement(text, "text:h", attrib={"text:outline-level": "6"})
-                h.text = line[7:]
-
-            elif line.strip() == '---' or line.strip() == '***':
-                p = ET.SubElement(text, "text:p")
-                p.text = "_" * 50
-
-            elif line.strip().startswith(('- ', '* ', '+ ')):
-                p = ET.SubElement(text, "text:p")
-                p.text = "• " + line.strip()[2:]
-            elif line.strip() and line.strip()[0].isdigit() and line.strip().find('.') == 1:
-                p = ET.SubElement(text, "text:p")
-                p.text = line.strip()
-
-            elif not line.strip():
-                p = ET.SubElement(text, "text:p")
-                p.text = ""
-
-            elif line.strip():
-
-                processed_line = line
-
-                processed_line = re.sub(r'\*\*(.*?)\*\*', r'\1', processed_line)
-
-                processed_line = re.sub(r'\*(.*?)\*', r'\1', processed_line)
-
-                processed_line = re.sub(r'`(.*?)`', r'\1', processed_line)
-
-                processed_line = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', processed_line)
-
-                p = ET.SubElement(text, "text:p")
-                p.text = processed_line
-
-
-        with zipfile.ZipFile(file_path, 'w', zipfile.ZIP_DEFLATED) as odt:
-
-            odt.writestr('mimetype', 'application/vnd.oasis.opendocument.text')
-
-
-            content_str = ET.tostring(content, encoding='unicode', xml_declaration=True)
-            odt.writestr('content.xml', content_str)
-
-
-            manifest = ET.Element("manifest:manifest")
-            manifest.set("xmlns:manifest", "urn:oasis:names:tc:opendocument:xmlns:manifest:1.0")
-
-            file_entry1 = ET.SubElement(manifest, "manifest:file-entry")
-            file_entry1.set("manifest:full-path", "/")
-            file_entry1.set("manifest:media-type", "application/vnd.oasis.opendocument.text")
-
-            file_entry2 = ET.SubElement(manifest, "manifest:file-entry")
-            file_entry2.set("manifest:full-path", "content.xml")
-            file_entry2.set("manifest:media-type", "text/xml")
-
-            manifest_str = ET.tostring(manifest, encoding='unicode', xml_declaration=True)
-            odt.writestr('META-INF/manifest.xml', manifest_str)
+        _export_odt(self._editor_text(), file_path)
 
 
 def main():
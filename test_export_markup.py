@@ -0,0 +1,76 @@
+"""Check the markup rewriting shared by the document exporters."""
+
+import pytest
+
+from markdown_editor import (
+    _PDF_INLINE_MARKUP,
+    _PLAIN_INLINE_MARKUP,
+    _export_text,
+    _iter_markdown_blocks,
+    _render_inline,
+)
+
+
+@pytest.mark.parametrize("line, expected", [
+    ("no markup here", "no markup here"),
+    ("**bold** and *italic*", "bold and italic"),
+    ("***x***", "x"),
+    ("**a *b* c**", "a b c"),
+    ("*a **b** c*", "a b c"),
+    ("text ***both*** text", "text both text"),
+    ("[link *text*](https://example.com)", "link text"),
+    ("an empty ** pair", "an empty  pair"),
+    ("a lone * star", "a lone * star"),
+])
+def test_render_inline_plain(line, expected):
+    assert _render_inline(line, _PLAIN_INLINE_MARKUP) == expected
+
+
+@pytest.mark.parametrize("line, expected", [
+    ("***x***", "<i><b>x</b></i>"),
+    ("**a *b* c**", "<b>a <i>b</i> c</b>"),
+    ("*a **b** c*", "<i>a <b>b</b> c</i>"),
+    ("`code`", '<font name="Courier">code</font>'),
+])
+def test_render_inline_nests_markup(line, expected):
+    assert _render_inline(line, _PDF_INLINE_MARKUP) == expected
+
+
+@pytest.mark.parametrize("markdown_text, expected", [
+    ("# Title\n\nBody text.", "Title\n\nBody text."),
+    ("***x***", "x"),
+    ("**a *b* c**", "a b c"),
+    ("*a **b** c*", "a b c"),
+    ("Keep `*code*` verbatim.", "Keep *code* verbatim."),
+    ("```python\nprint('*hi*')\n```", "print('*hi*')"),
+    ("![diagram](img.png) and [link](https://example.com)", "[diagram] and link"),
+    ("## **Bold heading**", "Bold heading"),
+])
+def test_export_text(tmp_path, markdown_text, expected):
+    file_path = tmp_path / "out.txt"
+    _export_text(markdown_text, str(file_path))
+    assert file_path.read_text(encoding="utf-8") == expected
+
+
+@pytest.mark.parametrize("markdown_text, expected", [
+    ("```python\nx = 1\n\ny = 2\n```", [('code', ['x = 1', '', 'y = 2'])]),
+    ("```\n```\nafter", [('paragraph', 'after')]),
+    ("before\n```\nnever closed\n# not a heading", [('paragraph', 'before')]),
+    ("# One\n## Two\n### Three\n#### Four\n##### Five\n###### Six", [
+        ('heading', (1, 'One')),
+        ('heading', (2, 'Two')),
+        ('heading', (3, 'Three')),
+        ('heading', (4, 'Four')),
+        ('heading', (5, 'Five')),
+        ('heading', (6, 'Six')),
+    ]),
+    ("####### Seven\n#NoSpace", [('paragraph', '####### Seven'), ('paragraph', '#NoSpace')]),
+    ("---\n***\n  ---  ", [('rule', ''), ('rule', ''), ('rule', '')]),
+    ("* * *", [('bullet', '* *')]),
+    ("- dash\n* star\n  + plus", [('bullet', 'dash'), ('bullet', 'star'), ('bullet', 'plus')]),
+    ("1. one\n  10. ten", [('numbered', '1. one'), ('numbered', '10. ten')]),
+    ("1.5 is not a list item", [('paragraph', '1.5 is not a list item')]),
+    ("a\n\n   \nb", [('paragraph', 'a'), ('blank', ''), ('blank', ''), ('paragraph', 'b')]),
+])
+def test_iter_markdown_blocks(markdown_text, expected):
+    assert list(_iter_markdown_blocks(markdown_text)) == expected
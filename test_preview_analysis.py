@@ -0,0 +1,78 @@
+"""Check the incremental preview renderer and word counter against the plain pipelines they replace."""
+
+import os
+import re
+
+import markdown
+import pytest
+
+from markdown_editor import MarkdownAnalyzer, _render_preview_html
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+with open(os.path.join(HERE, "test_sample.md"), encoding="utf-8") as sample_file:
+    SAMPLE = sample_file.read()
+
+DOCUMENTS = [
+    "",
+    "Just one paragraph.",
+    SAMPLE,
+    "# Title\n\nIntro with *emphasis*, __strong__ and `code`.\n\n## Section\n\nMore text.\n",
+    "- one\n- two\n    - nested\n    - nested too\n\n- loose item\n\n1. first\n2. second\n\n10. tenth\n",
+    "| a | b |\n|---|---|\n| 1 | 2 |\n\nAfter the table.\n",
+    "```python\ndef f():\n\n    return 1\n```\n\nText between.\n\n```\nplain\n```",
+    "    indented code\n\n    more code\n\nparagraph\n",
+    "> quote line\n>\n> second paragraph\n\n> another quote\n",
+    "Line one\nline two\n\n---\n\n![alt](image.png) and [link](https://example.com)\n",
+    "See [the docs][docs].\n\n[docs]: https://example.com\n",
+    "<div>raw html</div>\n\nparagraph\n",
+    "[TOC]\n\n# One\n\n## Two\n",
+    "\n\nLeading blank lines\n\n# Heading\n",
+    "# Same\n\ntext\n\n# Same\n\ntext\n",
+    "Trailing spaces  \nbreak\n\n\n\nmany blank lines\n\t\nand a tab line\n",
+    "___\n    code\n  \n# H",
+    "```\nfenced\n```\n    indented\n\n# After both\n",
+    "Intro\n\n    indented\n\n```\nfenced\n```\n\nafter\n",
+]
+
+
+def _full_render(text):
+    return markdown.markdown(text, extensions=['codehilite', 'tables', 'toc'])
+
+
+def _regex_word_count(text):
+    """The word count the analyzer used before it scanned for fences itself."""
+
+    text_without_code = re.sub(r'```.*?```', '', text, flags=re.DOTALL)
+    text_without_code = re.sub(r'`[^`]+`', '', text_without_code)
+    return len(re.findall(r'\b\w+\b', text_without_code))
+
+
+@pytest.mark.parametrize("text", DOCUMENTS)
+def test_preview_matches_full_render(text):
+    html, _ = _render_preview_html(text, {})
+    assert html == _full_render(text)
+
+
+@pytest.mark.parametrize("text", DOCUMENTS)
+def test_preview_reuses_block_cache(text):
+    _, blocks = _render_preview_html(text, {})
+    edited = text + "\n\nAn appended paragraph.\n"
+    html, _ = _render_preview_html(edited, blocks)
+    assert html == _full_render(edited)
+
+
+@pytest.mark.parametrize("text", DOCUMENTS + [
+    "Inline `code span` and ``double `tick` span`` here.",
+    "An unterminated ``` fence\nstill counts words",
+    "Text ```inline fence``` more text",
+    "```\ncode one\n```\nprose\n```\ncode two\n```\n",
+    "Backticks `across\nlines` are stripped",
+    "Empty `` pair and a lone ` tick",
+    "~~~\ntilde fence words\n~~~\n",
+    "Unicode wörter, naïve café, 数字 123 and snake_case_words.",
+    "Punctuation: don't, e-mail, 3.14, a/b, (paren).",
+])
+def test_word_count_matches_regex_pipeline(text):
+    assert MarkdownAnalyzer(text)._count_words() == _regex_word_count(text)